@@ -9,6 +9,7 @@ Create Date: 2025-02-28 18:48:23.244941
 from typing import Sequence, Union
 
 from alembic import op
+from loguru import logger
 
 
 # revision identifiers, used by Alembic.
@@ -93,8 +94,7 @@ def downgrade() -> None:
     );
     """)
 
-    # Print instruction to manually reindex after migration
-    print("\n------------------------------------------------------------------")
-    print("IMPORTANT: After downgrade completes, manually run the reindex command:")
-    print("basic-memory sync")
-    print("------------------------------------------------------------------\n")
+    # Log instruction to manually reindex after migration
+    logger.warning(
+        "IMPORTANT: After downgrade completes, manually run the reindex command: basic-memory sync"
+    )
@@ -0,0 +1,33 @@
+"""Add (project_id, file_path) index to entity
+
+Revision ID: f8a9c2d41b7e
+Revises: e7e1f4367280
+Create Date: 2025-10-28 10:15:32.481920
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "f8a9c2d41b7e"
+down_revision: Union[str, None] = "e7e1f4367280"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Lets directory listings answer "project_id = ? AND file_path in [prefix/, prefix0)"
+    # with a single index range scan
+    op.create_index(
+        "ix_entity_project_file_path",
+        "entity",
+        ["project_id", "file_path"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_entity_project_file_path", table_name="entity")
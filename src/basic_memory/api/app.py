@@ -5,20 +5,21 @@ from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, HTTPException
 from fastapi.exception_handlers import http_exception_handler
+from fastapi.responses import ORJSONResponse
 from loguru import logger
 
 from basic_memory import __version__ as version
 from basic_memory import db
 from basic_memory.api.routers import (
-    directory_router,
-    importer_router,
+    directory,
+    importer,
     knowledge,
     management,
     memory,
     project,
     resource,
     search,
-    prompt_router,
+    prompt,
 )
 from basic_memory.config import ConfigManager
 from basic_memory.services.initialization import initialize_file_sync, initialize_app
@@ -64,18 +65,22 @@ app = FastAPI(
     description="Knowledge graph API for basic-memory",
     version=version,
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 
-# Include routers
-app.include_router(knowledge.router, prefix="/{project}")
-app.include_router(memory.router, prefix="/{project}")
-app.include_router(resource.router, prefix="/{project}")
-app.include_router(search.router, prefix="/{project}")
-app.include_router(project.project_router, prefix="/{project}")
-app.include_router(directory_router.router, prefix="/{project}")
-app.include_router(prompt_router.router, prefix="/{project}")
-app.include_router(importer_router.router, prefix="/{project}")
+# Include project-scoped routers
+for project_scoped_router in (
+    knowledge.router,
+    memory.router,
+    resource.router,
+    search.router,
+    project.project_router,
+    directory.router,
+    prompt.router,
+    importer.router,
+):
+    app.include_router(project_scoped_router, prefix="/{project}")
 
 # Project resource router works accross projects
 app.include_router(project.project_resource_router)
@@ -86,13 +91,17 @@ app.include_router(management.router)
 
 @app.exception_handler(Exception)
 async def exception_handler(request, exc):  # pragma: no cover
+    # Stringify the error once for both the log record and the response
+    error = str(exc)
+    client = request.client
+    url = request.url
     logger.exception(
         "API unhandled exception",
-        url=str(request.url),
+        url=str(url),
         method=request.method,
-        client=request.client.host if request.client else None,
-        path=request.url.path,
+        client=client.host if client else None,
+        path=url.path,
         error_type=type(exc).__name__,
-        error=str(exc),
+        error=error,
     )
-    return await http_exception_handler(request, HTTPException(status_code=500, detail=str(exc)))
+    return await http_exception_handler(request, HTTPException(status_code=500, detail=error))
@@ -1,5 +1,7 @@
 """API routers."""
 
+from . import directory_router as directory
+from . import importer_router as importer
 from . import knowledge_router as knowledge
 from . import management_router as management
 from . import memory_router as memory
@@ -8,4 +10,14 @@ from . import resource_router as resource
 from . import search_router as search
 from . import prompt_router as prompt
 
-__all__ = ["knowledge", "management", "memory", "project", "resource", "search", "prompt"]
+__all__ = [
+    "directory",
+    "importer",
+    "knowledge",
+    "management",
+    "memory",
+    "project",
+    "resource",
+    "search",
+    "prompt",
+]
@@ -4,6 +4,7 @@ from typing import Annotated
 
 from fastapi import APIRouter, HTTPException, BackgroundTasks, Depends, Query, Response
 from loguru import logger
+from pydantic import TypeAdapter
 
 from basic_memory.deps import (
     EntityServiceDep,
@@ -27,6 +28,9 @@ from basic_memory.schemas.base import Permalink, Entity
 
 router = APIRouter(prefix="/knowledge", tags=["knowledge"])
 
+# Validates a whole list of ORM entities in one call into pydantic-core
+entity_response_list = TypeAdapter(list[EntityResponse])
+
 
 async def resolve_relations_background(sync_service, entity_id: int, entity_permalink: str) -> None:
     """Background task to resolve relations for a specific entity.
@@ -254,7 +258,7 @@ async def get_entities(
 
     entities = await entity_service.get_entities_by_permalinks(permalink) if permalink else []
     result = EntityListResponse(
-        entities=[EntityResponse.model_validate(entity) for entity in entities]
+        entities=entity_response_list.validate_python(entities, from_attributes=True)
     )
     return result
 
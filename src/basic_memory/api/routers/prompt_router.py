@@ -4,8 +4,9 @@ This router is responsible for rendering various prompts using Handlebars templa
 It centralizes all prompt formatting logic that was previously in the MCP prompts.
 """
 
+import asyncio
 from datetime import datetime, timezone
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, HTTPException, Response, status
 from loguru import logger
 
 from basic_memory.api.routers.utils import to_graph_context, to_search_results
@@ -17,6 +18,7 @@ from basic_memory.deps import (
     SearchServiceDep,
     EntityServiceDep,
 )
+from basic_memory.schemas.memory import GraphContext
 from basic_memory.schemas.prompt import (
     ContinueConversationRequest,
     SearchPromptRequest,
@@ -27,6 +29,24 @@ from basic_memory.schemas.search import SearchItemType, SearchQuery
 
 router = APIRouter(prefix="/prompt", tags=["prompt"])
 
+# Maximum number of context builds run concurrently for one prompt request
+CONTEXT_BUILD_CONCURRENCY = 8
+
+# Top results taken from each context, and the cap on results in a continuation prompt
+RESULTS_PER_CONTEXT = 3
+MAX_HIERARCHICAL_RESULTS = 10
+
+
+def _json_prompt_response(prompt_response: PromptResponse) -> Response:
+    """Serialize a prompt response straight to JSON bytes.
+
+    Returning a Response skips FastAPI's re-validation of the (potentially large)
+    rendered prompt and context against response_model, which is kept only for the
+    OpenAPI schema. Callers build the response with model_construct() so the context
+    is walked once, by the JSON serializer.
+    """
+    return Response(content=prompt_response.model_dump_json(), media_type="application/json")
+
 
 @router.post("/continue-conversation", response_model=PromptResponse)
 async def continue_conversation(
@@ -35,7 +55,7 @@ async def continue_conversation(
     context_service: ContextServiceDep,
     entity_repository: EntityRepositoryDep,
     request: ContinueConversationRequest,
-) -> PromptResponse:
+) -> Response:
     """Generate a prompt for continuing a conversation.
 
     This endpoint takes a topic and/or timeframe and generates a prompt with
@@ -58,34 +78,61 @@ async def continue_conversation(
 
     # Get data needed for template
     if request.topic:
-        query = SearchQuery(text=request.topic, after_date=request.timeframe)
+        # Request fields are already validated, so skip a second validation pass
+        query = SearchQuery.model_construct(text=request.topic, after_date=request.timeframe)
         results = await search_service.search(query, limit=request.search_items_limit)
         search_results = await to_search_results(entity_service, results)
 
-        # Build context from results
-        all_hierarchical_results = []
-        for result in search_results:
-            if hasattr(result, "permalink") and result.permalink:
-                # Get hierarchical context using the new dataclass-based approach
-                context_result = await context_service.build_context(
-                    result.permalink,
-                    depth=request.depth,
-                    since=since,
-                    max_related=request.related_items_limit,
-                    include_observations=True,  # Include observations for entities
-                )
+        # Build context for every result permalink with shared primary/observation lookups
+        permalinks = [
+            result.permalink
+            for result in search_results
+            if hasattr(result, "permalink") and result.permalink
+        ]
+        context_results = await context_service.build_context_batch(
+            permalinks,
+            depth=request.depth,
+            since=since,
+            max_related=request.related_items_limit,
+            include_observations=True,  # Include observations for entities
+        )
+
+        # Bound the number of concurrent database sessions used by the fan-out
+        semaphore = asyncio.Semaphore(CONTEXT_BUILD_CONCURRENCY)
 
+        async def build_graph_context(permalink: str) -> GraphContext:
+            async with semaphore:
                 # Process results into the schema format
-                graph_context = await to_graph_context(
-                    context_result, entity_repository=entity_repository
+                return await to_graph_context(
+                    context_results[permalink], entity_repository=entity_repository
                 )
 
-                # Add results to our collection (limit to top results for each permalink)
-                if graph_context.results:
-                    all_hierarchical_results.extend(graph_context.results[:3])
+        # Only convert the contexts that can make it into the final result list
+        selected_permalinks = []
+        selected_count = 0
+        for permalink in permalinks:
+            if selected_count >= MAX_HIERARCHICAL_RESULTS:
+                break
+            result_count = min(len(context_results[permalink].results), RESULTS_PER_CONTEXT)
+            if result_count:
+                selected_permalinks.append(permalink)
+                selected_count += result_count
+
+        # Convert results concurrently; the task group cancels the rest if one fails
+        async with asyncio.TaskGroup() as task_group:
+            tasks = [
+                task_group.create_task(build_graph_context(permalink))
+                for permalink in selected_permalinks
+            ]
+
+        # Build context from results
+        all_hierarchical_results = []
+        for task in tasks:
+            # Add results to our collection (limit to top results for each permalink)
+            all_hierarchical_results.extend(task.result().results[:RESULTS_PER_CONTEXT])
 
         # Limit to a reasonable number of total results
-        all_hierarchical_results = all_hierarchical_results[:10]
+        all_hierarchical_results = all_hierarchical_results[:MAX_HIERARCHICAL_RESULTS]
 
         template_context = {
             "topic": request.topic,
@@ -115,8 +162,9 @@ async def continue_conversation(
 
     try:
         # Render template
-        rendered_prompt = await template_loader.render(
-            "prompts/continue_conversation.hbs", template_context
+        # Render off the event loop; large contexts make this CPU-bound for a while
+        rendered_prompt = await asyncio.to_thread(
+            template_loader.render, "prompts/continue_conversation.hbs", template_context
         )
 
         # Calculate metadata
@@ -179,8 +227,10 @@ async def continue_conversation(
 
         prompt_metadata = PromptMetadata(**metadata)
 
-        return PromptResponse(
-            prompt=rendered_prompt, context=template_context, metadata=prompt_metadata
+        return _json_prompt_response(
+            PromptResponse.model_construct(
+                prompt=rendered_prompt, context=template_context, metadata=prompt_metadata
+            )
         )
     except Exception as e:
         logger.error(f"Error rendering continue conversation template: {e}")
@@ -197,7 +247,7 @@ async def search_prompt(
     request: SearchPromptRequest,
     page: int = 1,
     page_size: int = 10,
-) -> PromptResponse:
+) -> Response:
     """Generate a prompt for search results.
 
     This endpoint takes a search query and formats the results into a helpful
@@ -216,7 +266,7 @@ async def search_prompt(
     limit = page_size
     offset = (page - 1) * page_size
 
-    query = SearchQuery(text=request.query, after_date=request.timeframe)
+    query = SearchQuery.model_construct(text=request.query, after_date=request.timeframe)
     results = await search_service.search(query, limit=limit, offset=offset)
     search_results = await to_search_results(entity_service, results)
 
@@ -230,7 +280,9 @@ async def search_prompt(
 
     try:
         # Render template
-        rendered_prompt = await template_loader.render("prompts/search.hbs", template_context)
+        rendered_prompt = await asyncio.to_thread(
+            template_loader.render, "prompts/search.hbs", template_context
+        )
 
         # Build metadata
         metadata = {
@@ -249,8 +301,10 @@ async def search_prompt(
 
         prompt_metadata = PromptMetadata(**metadata)
 
-        return PromptResponse(
-            prompt=rendered_prompt, context=template_context, metadata=prompt_metadata
+        return _json_prompt_response(
+            PromptResponse.model_construct(
+                prompt=rendered_prompt, context=template_context, metadata=prompt_metadata
+            )
         )
     except Exception as e:
         logger.error(f"Error rendering search template: {e}")
@@ -24,8 +24,26 @@ async def to_graph_context(
     page: Optional[int] = None,
     page_size: Optional[int] = None,
 ):
+    # Load every entity referenced by a relation in one query instead of two lookups per relation
+    relation_entity_ids = {
+        entity_id
+        for context_item in context_result.results
+        for item in [context_item.primary_result, *context_item.related_results]
+        if item.type == SearchItemType.RELATION
+        for entity_id in (item.from_id, item.to_id)
+        if entity_id
+    }
+    entity_titles = (
+        {
+            entity.id: entity.title
+            for entity in await entity_repository.find_by_ids(list(relation_entity_ids))
+        }
+        if relation_entity_ids
+        else {}
+    )
+
     # Helper function to convert items to summaries
-    async def to_summary(item: SearchIndexRow | ContextResultRow):
+    def to_summary(item: SearchIndexRow | ContextResultRow):
         match item.type:
             case SearchItemType.ENTITY:
                 return EntitySummary(
@@ -45,15 +63,13 @@ async def to_graph_context(
                     created_at=item.created_at,
                 )
             case SearchItemType.RELATION:
-                from_entity = await entity_repository.find_by_id(item.from_id)  # pyright: ignore
-                to_entity = await entity_repository.find_by_id(item.to_id) if item.to_id else None
                 return RelationSummary(
                     title=item.title,  # pyright: ignore
                     file_path=item.file_path,
                     permalink=item.permalink,  # pyright: ignore
                     relation_type=item.relation_type,  # pyright: ignore
-                    from_entity=from_entity.title if from_entity else None,
-                    to_entity=to_entity.title if to_entity else None,
+                    from_entity=entity_titles.get(item.from_id),  # pyright: ignore
+                    to_entity=entity_titles.get(item.to_id) if item.to_id else None,
                     created_at=item.created_at,
                 )
             case _:  # pragma: no cover
@@ -63,17 +79,13 @@ async def to_graph_context(
     hierarchical_results = []
     for context_item in context_result.results:
         # Process primary result
-        primary_result = await to_summary(context_item.primary_result)
+        primary_result = to_summary(context_item.primary_result)
 
         # Process observations
-        observations = []
-        for obs in context_item.observations:
-            observations.append(await to_summary(obs))
+        observations = [to_summary(obs) for obs in context_item.observations]
 
         # Process related results
-        related = []
-        for rel in context_item.related_results:
-            related.append(await to_summary(rel))
+        related = [to_summary(rel) for rel in context_item.related_results]
 
         # Add to hierarchical results
         hierarchical_results.append(
@@ -108,9 +120,27 @@ async def to_graph_context(
 
 
 async def to_search_results(entity_service: EntityService, results: List[SearchIndexRow]):
+    # Load the entities referenced by every result in one query, rather than one per result
+    entity_ids = {
+        entity_id
+        for r in results
+        for entity_id in (r.entity_id, r.from_id, r.to_id)
+        if entity_id is not None
+    }
+    entities_by_id = (
+        {entity.id: entity for entity in await entity_service.get_entities_by_id(list(entity_ids))}
+        if entity_ids
+        else {}
+    )
+
     search_results = []
     for r in results:
-        entities = await entity_service.get_entities_by_id([r.entity_id, r.from_id, r.to_id])  # pyright: ignore
+        # The referenced entities that exist, in id order as the per-result lookup returned them
+        entities = [
+            entities_by_id[entity_id]
+            for entity_id in sorted({r.entity_id, r.from_id, r.to_id} - {None})  # pyright: ignore
+            if entity_id in entities_by_id
+        ]
         search_results.append(
             SearchResult(
                 title=r.title,  # pyright: ignore
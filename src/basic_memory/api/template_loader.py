@@ -6,11 +6,12 @@ formatting needs.
 """
 
 import textwrap
+from functools import lru_cache
 from typing import Dict, Any, Optional, Callable
 from pathlib import Path
-import json
 import datetime
 
+import orjson
 import pybars
 from loguru import logger
 
@@ -18,6 +19,12 @@ from loguru import logger
 TEMPLATES_DIR = Path(__file__).parent.parent / "templates"
 
 
+@lru_cache(maxsize=1024)
+def _format_iso_date(timestamp: str, format_str: str) -> str:
+    """Parse an ISO timestamp string and format it, memoized for repeated values."""
+    return datetime.datetime.fromisoformat(timestamp).strftime(format_str)
+
+
 # Custom helpers for Handlebars
 def _date_helper(this, *args):
     """Format a date using the given format string."""
@@ -31,8 +38,7 @@ def _date_helper(this, *args):
         result = timestamp.strftime(format_str)
     elif isinstance(timestamp, str):
         try:
-            dt = datetime.datetime.fromisoformat(timestamp)
-            result = dt.strftime(format_str)
+            result = _format_iso_date(timestamp, format_str)
         except ValueError:
             result = timestamp
     else:
@@ -106,8 +112,8 @@ def _json_helper(this, *args):
         return "{}"
 
     value = args[0]
-    # For pybars, we need to return a SafeString to prevent HTML escaping
-    result = json.dumps(value)  # pragma: no cover
+    # orjson encodes dates natively; default=str covers other types such as paths
+    result = orjson.dumps(value, default=str).decode()  # pragma: no cover
     # Safe string implementation to prevent HTML escaping
     return pybars.strlist([result])
 
@@ -214,7 +220,7 @@ class TemplateLoader:
         Args:
             template_dir: Optional custom template directory path
         """
-        self.template_dir = Path(template_dir) if template_dir else TEMPLATES_DIR
+        self.template_dir = (Path(template_dir) if template_dir else TEMPLATES_DIR).resolve()
         self.template_cache: Dict[str, Callable] = {}
         self.compiler = pybars.Compiler()
 
@@ -232,8 +238,40 @@ class TemplateLoader:
             "dedent": _dedent_helper,
         }
 
+        # Compile every bundled template up front so no request pays the parse cost
+        self.precompile_templates()
+
         logger.debug(f"Initialized template loader with directory: {self.template_dir}")
 
+    @staticmethod
+    def normalize_template_path(template_path: str) -> str:
+        """Normalize a template path to the .hbs form used as the cache key.
+
+        Args:
+            template_path: Template path with a .hbs, .liquid, or no extension
+
+        Returns:
+            The template path with a .hbs extension
+        """
+        # Convert from Liquid-style path to Handlebars extension
+        if template_path.endswith(".liquid"):
+            return template_path.replace(".liquid", ".hbs")
+        elif not template_path.endswith(".hbs"):
+            return f"{template_path}.hbs"
+        return template_path
+
+    def precompile_templates(self) -> None:
+        """Compile all .hbs templates under the template directory into the cache."""
+        if not self.template_dir.is_dir():
+            return
+
+        for full_path in self.template_dir.rglob("*.hbs"):
+            template_path = full_path.relative_to(self.template_dir).as_posix()
+            template_str = full_path.read_text(encoding="utf-8")
+            self.template_cache[template_path] = self.compiler.compile(template_str)
+
+        logger.debug(f"Precompiled {len(self.template_cache)} templates")
+
     def get_template(self, template_path: str) -> Callable:
         """Get a template by path, using cache if available.
 
@@ -246,22 +284,25 @@ class TemplateLoader:
         Raises:
             FileNotFoundError: If the template doesn't exist
         """
-        if template_path in self.template_cache:
-            return self.template_cache[template_path]
+        # Fast path: callers normally pass the already-normalized .hbs path,
+        # so a hit here is a single dict lookup with no string handling
+        template = self.template_cache.get(template_path)
+        if template is not None:
+            return template
 
-        # Convert from Liquid-style path to Handlebars extension
-        if template_path.endswith(".liquid"):
-            template_path = template_path.replace(".liquid", ".hbs")
-        elif not template_path.endswith(".hbs"):
-            template_path = f"{template_path}.hbs"
+        template_path = self.normalize_template_path(template_path)
+        template = self.template_cache.get(template_path)
+        if template is not None:
+            return template
 
         full_path = self.template_dir / template_path
 
-        if not full_path.exists():
-            raise FileNotFoundError(f"Template not found: {full_path}")
-
-        with open(full_path, "r", encoding="utf-8") as f:
-            template_str = f.read()
+        # Let open() detect a missing template rather than paying for an extra stat call
+        try:
+            with open(full_path, "r", encoding="utf-8") as f:
+                template_str = f.read()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Template not found: {full_path}") from None
 
         template = self.compiler.compile(template_str)
         self.template_cache[template_path] = template
@@ -269,7 +310,7 @@ class TemplateLoader:
         logger.debug(f"Loaded template: {template_path}")
         return template
 
-    async def render(self, template_path: str, context: Dict[str, Any]) -> str:
+    def render(self, template_path: str, context: Dict[str, Any]) -> str:
         """Render a template with the given context.
 
         Args:
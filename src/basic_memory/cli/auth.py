@@ -9,6 +9,7 @@ import time
 import webbrowser
 
 import httpx
+import orjson
 from rich.console import Console
 
 from basic_memory.config import ConfigManager
@@ -179,9 +180,8 @@ class CLIAuth:
             return None
 
         try:
-            with open(self.token_file) as f:
-                return json.load(f)
-        except (OSError, json.JSONDecodeError):
+            return orjson.loads(self.token_file.read_bytes())
+        except (OSError, orjson.JSONDecodeError):
             return None
 
     def is_token_valid(self, tokens: dict) -> bool:
@@ -61,14 +61,11 @@ if not config.cloud_mode_enabled:
 
         def run_file_sync():
             """Run file sync in a separate thread with its own event loop."""
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
             try:
-                loop.run_until_complete(initialize_file_sync(app_config))
+                # asyncio.run() creates, finalizes and closes the thread's loop for us
+                asyncio.run(initialize_file_sync(app_config))
             except Exception as e:
                 logger.error(f"File sync error: {e}", err=True)
-            finally:
-                loop.close()
 
         logger.info(f"Sync changes enabled: {app_config.sync_changes}")
         if app_config.sync_changes:
@@ -28,9 +28,9 @@ def add_files_to_tree(
     # Group by directory
     by_dir = {}
     for path in sorted(paths):
-        parts = path.split("/", 1)
-        dir_name = parts[0] if len(parts) > 1 else ""
-        file_name = parts[1] if len(parts) > 1 else parts[0]
+        dir_name, sep, file_name = path.partition("/")
+        if not sep:
+            dir_name, file_name = "", path
         by_dir.setdefault(dir_name, []).append((file_name, path))
 
     # Add to tree
@@ -40,7 +40,8 @@ def add_files_to_tree(
         else:
             branch = tree
 
-        for file_name, full_path in sorted(files):
+        # Paths were added in sorted order, so each directory's files are already sorted
+        for file_name, full_path in files:
             if checksums and full_path in checksums:
                 checksum_short = checksums[full_path][:8]
                 branch.add(f"[{style}]{file_name}[/{style}] ({checksum_short})")
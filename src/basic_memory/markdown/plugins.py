@@ -1,15 +1,20 @@
 """Markdown-it plugins for Basic Memory markdown parsing."""
 
+import re
 from typing import List, Any, Dict
 from markdown_it import MarkdownIt
 from markdown_it.token import Token
 
+# Patterns used for every inline token, compiled once at import
+MARKDOWN_LINK_PATTERN = re.compile(r"^\[.*?\]\(.*?\)$")
+WIKI_LINK_PATTERN = re.compile(r"^\[\[.*?\]\]$")
+OBSERVATION_PATTERN = re.compile(r"^\[([^\[\]()]+)\]\s+(.+)")
+EMPTY_CATEGORY_PATTERN = re.compile(r"^\[\]\s+(.+)")
+
 
 # Observation handling functions
 def is_observation(token: Token) -> bool:
     """Check if token looks like our observation format."""
-    import re
-
     if token.type != "inline":  # pragma: no cover
         return False
     # Use token.tag which contains the actual content for test tokens, fallback to content
@@ -21,35 +26,33 @@ def is_observation(token: Token) -> bool:
         return False
 
     # Exclude markdown links: [text](url)
-    if re.match(r"^\[.*?\]\(.*?\)$", content):
+    if MARKDOWN_LINK_PATTERN.match(content):
         return False
 
     # Exclude wiki links: [[text]]
-    if re.match(r"^\[\[.*?\]\]$", content):
+    if WIKI_LINK_PATTERN.match(content):
         return False
 
     # Check for proper observation format: [category] content
-    match = re.match(r"^\[([^\[\]()]+)\]\s+(.+)", content)
+    match = OBSERVATION_PATTERN.match(content)
     has_tags = "#" in content
     return bool(match) or has_tags
 
 
 def parse_observation(token: Token) -> Dict[str, Any]:
     """Extract observation parts from token."""
-    import re
-
     # Use token.tag which contains the actual content for test tokens, fallback to content
     content = (token.tag or token.content).strip()
 
     # Parse [category] with regex
-    match = re.match(r"^\[([^\[\]()]+)\]\s+(.+)", content)
+    match = OBSERVATION_PATTERN.match(content)
     category = None
     if match:
         category = match.group(1).strip()
         content = match.group(2).strip()
     else:
         # Handle empty brackets [] followed by content
-        empty_match = re.match(r"^\[\]\s+(.+)", content)
+        empty_match = EMPTY_CATEGORY_PATTERN.match(content)
         if empty_match:
             content = empty_match.group(1).strip()
 
@@ -86,7 +86,7 @@ async def get_client() -> AsyncIterator[AsyncClient]:
 
             # Auth header set ONCE at client creation
             proxy_base_url = f"{config.cloud_host}/proxy"
-            logger.info(f"Creating HTTP client for cloud proxy at: {proxy_base_url}")
+            logger.debug("Creating HTTP client for cloud proxy at: {}", proxy_base_url)
             async with AsyncClient(
                 base_url=proxy_base_url,
                 headers={"Authorization": f"Bearer {token}"},
@@ -95,7 +95,7 @@ async def get_client() -> AsyncIterator[AsyncClient]:
                 yield client
         else:
             # Local mode: ASGI transport for in-process calls
-            logger.info("Creating ASGI client for local Basic Memory API")
+            logger.debug("Creating ASGI client for local Basic Memory API")
             async with AsyncClient(
                 transport=ASGITransport(app=fastapi_app), base_url="http://test", timeout=timeout
             ) as client:
@@ -1,5 +1,6 @@
 """List directory tool for Basic Memory MCP server."""
 
+from operator import itemgetter
 from typing import Optional
 
 from loguru import logger
@@ -104,13 +105,19 @@ async def list_directory(
             output_lines.append(f"Contents of '{dir_name}' (depth {depth}):")
         output_lines.append("")
 
-        # Group by type and sort
-        directories = [n for n in nodes if n["type"] == "directory"]
-        files = [n for n in nodes if n["type"] == "file"]
-
-        # Sort by name
-        directories.sort(key=lambda x: x["name"])
-        files.sort(key=lambda x: x["name"])
+        # Group by type in a single pass
+        directories = []
+        files = []
+        for node in nodes:
+            if node["type"] == "directory":
+                directories.append(node)
+            elif node["type"] == "file":
+                files.append(node)
+
+        # Sort by name, using a C-level key getter rather than a lambda
+        by_name = itemgetter("name")
+        directories.sort(key=by_name)
+        files.sort(key=by_name)
 
         # Display directories first
         for node in directories:
@@ -22,6 +22,12 @@ from basic_memory.models.base import Base
 from basic_memory.utils import generate_permalink
 
 
+# SQL expression for an entity's parent directory, with a trailing "/" ("" at the root).
+# rtrim(path, <every non-slash char in path>) trims back to the last "/". Queries must use
+# this exact expression, with literals rather than bound parameters, to use the index on it
+ENTITY_PARENT_DIR_SQL = "rtrim(file_path, replace(file_path, '/', ''))"
+
+
 class Entity(Base):
     """Core entity in the knowledge graph.
 
@@ -41,6 +47,10 @@ class Entity(Base):
         Index("ix_entity_created_at", "created_at"),  # For timeline queries
         Index("ix_entity_updated_at", "updated_at"),  # For timeline queries
         Index("ix_entity_project_id", "project_id"),  # For project filtering
+        # For directory listings (file_path range scans within a project)
+        Index("ix_entity_project_file_path", "project_id", "file_path"),
+        # For distinct parent directories, answered from the index alone
+        Index("ix_entity_project_parent_dir", "project_id", text(ENTITY_PARENT_DIR_SQL)),
         # Project-specific uniqueness constraints
         Index(
             "uix_entity_permalink_project",
@@ -122,9 +132,11 @@ class Entity(Base):
         """Override attribute access to ensure datetime fields are timezone-aware."""
         value = super().__getattribute__(name)
 
-        # Ensure datetime fields are timezone-aware
-        if name in ("created_at", "updated_at") and isinstance(value, datetime):
-            return ensure_timezone_aware(value)
+        # Ensure datetime fields are timezone-aware. This runs on every attribute access,
+        # so other names return after one comparison and aware values skip the conversion
+        if name == "created_at" or name == "updated_at":
+            if isinstance(value, datetime) and value.tzinfo is None:
+                return ensure_timezone_aware(value)
 
         return value
 
@@ -4,14 +4,14 @@ from pathlib import Path
 from typing import List, Optional, Sequence, Union
 
 from loguru import logger
-from sqlalchemy import select
+from sqlalchemy import literal_column, select
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 from sqlalchemy.orm import selectinload
 from sqlalchemy.orm.interfaces import LoaderOption
 
 from basic_memory import db
-from basic_memory.models.knowledge import Entity, Observation, Relation
+from basic_memory.models.knowledge import ENTITY_PARENT_DIR_SQL, Entity, Observation, Relation
 from basic_memory.repository.repository import Repository
 
 
@@ -238,22 +238,24 @@ class EntityRepository(Repository[Entity]):
         Returns:
             List of unique directory paths (e.g., ["notes", "notes/meetings", "specs"])
         """
-        # Query only file_path column, no entity objects or relationships
-        query = select(Entity.file_path).distinct()
+        # Let SQLite strip each file name and collapse the parent directories, so only
+        # one row per directory is returned instead of one per file. The expression
+        # matches ix_entity_project_parent_dir, so DISTINCT is read off that index
+        query = select(literal_column(ENTITY_PARENT_DIR_SQL)).select_from(Entity).distinct()
         query = self._add_project_filter(query)
 
         # Execute with use_query_options=False to skip eager loading
         result = await self.execute_query(query, use_query_options=False)
-        file_paths = [row for row in result.scalars().all()]
 
-        # Parse file paths to extract unique directories
+        # Add each directory and its ancestors, deduplicating with a set
         directories = set()
-        for file_path in file_paths:
-            parts = [p for p in file_path.split("/") if p]
-            # Add all parent directories (exclude filename which is the last part)
-            for i in range(len(parts) - 1):
-                dir_path = "/".join(parts[: i + 1])
+        for parent_path in result.scalars():
+            # Walk up the parent directories; once a parent has been seen, all of its
+            # ancestors have been added too
+            dir_path = "/".join(p for p in parent_path.split("/") if p)
+            while dir_path and dir_path not in directories:
                 directories.add(dir_path)
+                dir_path = dir_path.rpartition("/")[0]
 
         return sorted(directories)
 
@@ -261,7 +263,7 @@ class EntityRepository(Repository[Entity]):
         """Find entities whose file_path starts with the given directory prefix.
 
         Optimized method for listing directory contents without loading all entities.
-        Uses SQL LIKE pattern matching to filter entities by directory path.
+        Uses an indexed range scan on file_path to filter entities by directory path.
 
         Args:
             directory_prefix: Directory path prefix (e.g., "docs", "docs/guides")
@@ -272,18 +274,24 @@ class EntityRepository(Repository[Entity]):
         """
         # Build SQL LIKE pattern
         if directory_prefix == "" or directory_prefix == "/":
-            # Root directory - return all entities
-            return await self.find_all()
+            # Root directory - return all entities, without eager loading like the prefix case
+            return await self.find_all(use_load_options=False)
 
         # Remove leading/trailing slashes for consistency
         directory_prefix = directory_prefix.strip("/")
 
-        # Query entities with file_path starting with prefix
-        # Pattern matches "prefix/" to ensure we get files IN the directory,
-        # not just files whose names start with the prefix
-        pattern = f"{directory_prefix}/%"
-
-        query = self.select().where(Entity.file_path.like(pattern))
+        # Query entities with file_path starting with "prefix/" to ensure we get files
+        # IN the directory, not just files whose names start with the prefix.
+        # Expressed as a range ("/" sorts just before "0") rather than LIKE so SQLite
+        # can answer it from the file_path index, and "_"/"%" in names are not wildcards
+        query = (
+            self.select()
+            .where(
+                Entity.file_path >= f"{directory_prefix}/",
+                Entity.file_path < f"{directory_prefix}0",
+            )
+            .order_by(Entity.id)
+        )
 
         # Skip eager loading - we only need basic entity fields for directory trees
         result = await self.execute_query(query, use_query_options=False)
@@ -1,5 +1,7 @@
 """Repository for managing Observation objects."""
 
+from itertools import groupby
+from operator import attrgetter
 from typing import Dict, List, Sequence
 
 from sqlalchemy import select
@@ -8,6 +10,9 @@ from sqlalchemy.ext.asyncio import async_sessionmaker
 from basic_memory.models import Observation
 from basic_memory.repository.repository import Repository
 
+# Maximum number of ids bound into a single IN (...) clause
+IN_CLAUSE_CHUNK_SIZE = 500
+
 
 class ObservationRepository(Repository[Observation]):
     """Repository for Observation model with memory-specific operations."""
@@ -46,7 +51,11 @@ class ObservationRepository(Repository[Observation]):
         return result.scalars().all()
 
     async def find_by_entities(self, entity_ids: List[int]) -> Dict[int, List[Observation]]:
-        """Find all observations for multiple entities in a single query.
+        """Find all observations for multiple entities.
+
+        Entity ids are queried in chunks of at most IN_CLAUSE_CHUNK_SIZE so large
+        lists stay well under SQLite's bound parameter limit. Typical lists fit in
+        a single query.
 
         Args:
             entity_ids: List of entity IDs to fetch observations for
@@ -57,16 +66,24 @@ class ObservationRepository(Repository[Observation]):
         if not entity_ids:  # pragma: no cover
             return {}
 
-        # Query observations for all entities in the list
-        query = select(Observation).filter(Observation.entity_id.in_(entity_ids))
-        result = await self.execute_query(query)
-        observations = result.scalars().all()
-
-        # Group observations by entity_id
-        observations_by_entity = {}
-        for obs in observations:
-            if obs.entity_id not in observations_by_entity:
-                observations_by_entity[obs.entity_id] = []
-            observations_by_entity[obs.entity_id].append(obs)
+        # Sorted, de-duplicated ids keep each entity's observations within one chunk
+        unique_ids = sorted(set(entity_ids))
+
+        observations_by_entity: Dict[int, List[Observation]] = {}
+        for start in range(0, len(unique_ids), IN_CLAUSE_CHUNK_SIZE):
+            chunk = unique_ids[start : start + IN_CLAUSE_CHUNK_SIZE]
+
+            # Ordered by entity_id so rows come back in ix_observation_entity_id order (the
+            # index implicitly ends in the rowid, id) and arrive already grouped
+            query = (
+                select(Observation)
+                .filter(Observation.entity_id.in_(chunk))
+                .order_by(Observation.entity_id, Observation.id)
+            )
+            result = await self.execute_query(query)
+
+            # Group the consecutive runs of observations for each entity_id
+            for entity_id, group in groupby(result.scalars().all(), key=attrgetter("entity_id")):
+                observations_by_entity[entity_id] = list(group)
 
         return observations_by_entity
@@ -165,7 +165,9 @@ class Repository[T: Base]:
         logger.debug(f"Finding all {self.Model.__name__} (skip={skip}, limit={limit})")
 
         async with db.scoped_session(self.session_maker) as session:
-            query = select(self.Model).offset(skip)
+            # Order by primary key so results (and pagination) don't depend on which
+            # index the planner picks for the project filter
+            query = select(self.Model).order_by(self.primary_key).offset(skip)
 
             # Only apply load options if requested
             if use_load_options:
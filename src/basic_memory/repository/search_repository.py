@@ -6,7 +6,6 @@ import time
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Any, Dict, List, Optional
-from pathlib import Path
 
 from loguru import logger
 from sqlalchemy import Executable, Result, text
@@ -17,7 +16,35 @@ from basic_memory.models.search import CREATE_SEARCH_INDEX
 from basic_memory.schemas.search import SearchItemType
 
 
-@dataclass
+# Static statements, built once so each call reuses the same TextClause
+INSERT_SEARCH_INDEX_ROW = text("""
+    INSERT INTO search_index (
+        id, title, content_stems, content_snippet, permalink, file_path, type, metadata,
+        from_id, to_id, relation_type,
+        entity_id, category,
+        created_at, updated_at,
+        project_id
+    ) VALUES (
+        :id, :title, :content_stems, :content_snippet, :permalink, :file_path, :type, :metadata,
+        :from_id, :to_id, :relation_type,
+        :entity_id, :category,
+        :created_at, :updated_at,
+        :project_id
+    )
+""")
+
+DELETE_BY_PERMALINK = text(
+    "DELETE FROM search_index WHERE permalink = :permalink AND project_id = :project_id"
+)
+
+DELETE_BY_ENTITY_ID = text(
+    "DELETE FROM search_index WHERE entity_id = :entity_id AND project_id = :project_id"
+)
+
+OPTIMIZE_SEARCH_INDEX = text("INSERT INTO search_index(search_index) VALUES('optimize')")
+
+
+@dataclass(slots=True)
 class SearchIndexRow:
     """Search result with score and metadata."""
 
@@ -60,18 +87,14 @@ class SearchIndexRow:
         if not self.type == SearchItemType.ENTITY.value and not self.file_path:
             return ""
 
-        # Normalize path separators to handle both Windows (\) and Unix (/) paths
-        normalized_path = Path(self.file_path).as_posix()
-
-        # Split the path by slashes
-        parts = normalized_path.split("/")
+        # Normalize path separators to handle both Windows (\) and Unix (/) paths,
+        # then drop the filename with a single rpartition
+        directory_path, sep, _ = self.file_path.replace("\\", "/").rpartition("/")
 
-        # If there's only one part (e.g., "README.md"), it's at the root
-        if len(parts) <= 1:
+        # No separator (e.g., "README.md") means the file is at the root
+        if not sep:
             return "/"
 
-        # Join all parts except the last one (filename)
-        directory_path = "/".join(parts[:-1])
         return f"/{directory_path}"
 
     def to_insert(self):
@@ -125,6 +148,17 @@ class SearchRepository:
             logger.error(f"Error initializing search index: {e}")
             raise e
 
+    async def optimize_search_index(self):
+        """Merge the FTS5 index segments into a single b-tree.
+
+        Run after bulk loads (e.g. a full reindex) so later queries don't pay
+        for walking the many small segments created by incremental inserts.
+        """
+        logger.debug("Optimizing search index")
+        async with db.scoped_session(self.session_maker) as session:
+            await session.execute(OPTIMIZE_SEARCH_INDEX)
+            await session.commit()
+
     def _prepare_boolean_query(self, query: str) -> str:
         """Prepare a Boolean query by quoting individual terms while preserving operators.
 
@@ -372,6 +406,7 @@ class SearchRepository:
         search_item_types: Optional[List[SearchItemType]] = None,
         limit: int = 10,
         offset: int = 0,
+        permalinks: Optional[List[str]] = None,
     ) -> List[SearchIndexRow]:
         """Search across all indexed content with fuzzy matching."""
         conditions = []
@@ -401,6 +436,14 @@ class SearchRepository:
             params["permalink"] = permalink
             conditions.append("permalink = :permalink")
 
+        # Handle exact search over several permalinks at once
+        if permalinks:
+            placeholders = []
+            for i, value in enumerate(permalinks):
+                params[f"permalink_{i}"] = value
+                placeholders.append(f":permalink_{i}")
+            conditions.append(f"permalink IN ({', '.join(placeholders)})")
+
         # Handle permalink match search, supports *
         if permalink_match:
             # For GLOB patterns, don't use _prepare_search_term as it will quote slashes
@@ -527,9 +570,7 @@ class SearchRepository:
         async with db.scoped_session(self.session_maker) as session:
             # Delete existing record if any
             await session.execute(
-                text(
-                    "DELETE FROM search_index WHERE permalink = :permalink AND project_id = :project_id"
-                ),
+                DELETE_BY_PERMALINK,
                 {"permalink": search_index_row.permalink, "project_id": self.project_id},
             )
 
@@ -539,21 +580,7 @@ class SearchRepository:
 
             # Insert new record
             await session.execute(
-                text("""
-                    INSERT INTO search_index (
-                        id, title, content_stems, content_snippet, permalink, file_path, type, metadata,
-                        from_id, to_id, relation_type,
-                        entity_id, category,
-                        created_at, updated_at,
-                        project_id
-                    ) VALUES (
-                        :id, :title, :content_stems, :content_snippet, :permalink, :file_path, :type, :metadata,
-                        :from_id, :to_id, :relation_type,
-                        :entity_id, :category,
-                        :created_at, :updated_at,
-                        :project_id
-                    )
-                """),
+                INSERT_SEARCH_INDEX_ROW,
                 insert_data,
             )
             logger.debug(f"indexed row {search_index_row}")
@@ -581,21 +608,7 @@ class SearchRepository:
 
             # Batch insert all records using executemany
             await session.execute(
-                text("""
-                    INSERT INTO search_index (
-                        id, title, content_stems, content_snippet, permalink, file_path, type, metadata,
-                        from_id, to_id, relation_type,
-                        entity_id, category,
-                        created_at, updated_at,
-                        project_id
-                    ) VALUES (
-                        :id, :title, :content_stems, :content_snippet, :permalink, :file_path, :type, :metadata,
-                        :from_id, :to_id, :relation_type,
-                        :entity_id, :category,
-                        :created_at, :updated_at,
-                        :project_id
-                    )
-                """),
+                INSERT_SEARCH_INDEX_ROW,
                 insert_data_list,
             )
             logger.debug(f"Bulk indexed {len(search_index_rows)} rows")
@@ -605,9 +618,7 @@ class SearchRepository:
         """Delete an item from the search index by entity_id."""
         async with db.scoped_session(self.session_maker) as session:
             await session.execute(
-                text(
-                    "DELETE FROM search_index WHERE entity_id = :entity_id AND project_id = :project_id"
-                ),
+                DELETE_BY_ENTITY_ID,
                 {"entity_id": entity_id, "project_id": self.project_id},
             )
             await session.commit()
@@ -616,9 +627,7 @@ class SearchRepository:
         """Delete an item from the search index."""
         async with db.scoped_session(self.session_maker) as session:
             await session.execute(
-                text(
-                    "DELETE FROM search_index WHERE permalink = :permalink AND project_id = :project_id"
-                ),
+                DELETE_BY_PERMALINK,
                 {"permalink": permalink, "project_id": self.project_id},
             )
             await session.commit()
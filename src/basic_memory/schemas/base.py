@@ -49,6 +49,50 @@ def to_snake_case(name: str) -> str:
     return s2.lower()
 
 
+# Relative timeframes like "7d", "2 weeks" or "1 hour ago"
+RELATIVE_TIMEFRAME_PATTERN = re.compile(
+    r"^(\d+)\s*(m|min|minute|h|hr|hour|d|day|w|wk|week)s?(\s+ago)?$", re.IGNORECASE
+)
+
+RELATIVE_TIMEFRAME_UNITS = {
+    "m": "minutes",
+    "min": "minutes",
+    "minute": "minutes",
+    "h": "hours",
+    "hr": "hours",
+    "hour": "hours",
+    "d": "days",
+    "day": "days",
+    "w": "weeks",
+    "wk": "weeks",
+    "week": "weeks",
+}
+
+
+def parse_datetime(value: str) -> Optional[datetime]:
+    """Parse a timeframe or date string, trying the common formats before dateparser.
+
+    Handles "yesterday", relative expressions ("7d", "1 week ago") and ISO 8601 dates
+    directly; anything else falls back to dateparser, which is much slower.
+
+    Returns:
+        The parsed datetime (naive unless the input carries an offset), or None
+    """
+    value = value.strip()
+    if value.lower() == "yesterday":
+        return datetime.now() - timedelta(days=1)
+
+    match = RELATIVE_TIMEFRAME_PATTERN.match(value)
+    if match:
+        amount, unit = int(match.group(1)), RELATIVE_TIMEFRAME_UNITS[match.group(2).lower()]
+        return datetime.now() - timedelta(**{unit: amount})
+
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        return parse(value)
+
+
 def parse_timeframe(timeframe: str) -> datetime:
     """Parse timeframe with special handling for 'today' and other natural language expressions.
 
@@ -74,8 +118,7 @@ def parse_timeframe(timeframe: str) -> datetime:
         one_day_ago = now - timedelta(days=1)
         return one_day_ago.astimezone()
     else:
-        # Use dateparser for other formats
-        parsed = parse(timeframe)
+        parsed = parse_datetime(timeframe)
         if not parsed:
             raise ValueError(f"Could not parse timeframe: {timeframe}")
 
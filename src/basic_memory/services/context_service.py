@@ -2,11 +2,13 @@
 
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import List, Optional, Tuple
+from itertools import chain
+from typing import Dict, List, Optional, Tuple
 
 from loguru import logger
 from sqlalchemy import text
 
+from basic_memory.models import Observation
 from basic_memory.repository.entity_repository import EntityRepository
 from basic_memory.repository.observation_repository import ObservationRepository
 from basic_memory.repository.search_repository import SearchRepository, SearchIndexRow
@@ -15,7 +17,7 @@ from basic_memory.schemas.search import SearchItemType
 from basic_memory.utils import generate_permalink
 
 
-@dataclass
+@dataclass(slots=True)
 class ContextResultRow:
     type: str
     id: int
@@ -33,7 +35,7 @@ class ContextResultRow:
     entity_id: Optional[int] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ContextResultItem:
     """A hierarchical result containing a primary item with its observations and related items."""
 
@@ -42,7 +44,7 @@ class ContextResultItem:
     related_results: List[ContextResultRow] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class ContextMetadata:
     """Metadata about a context result."""
 
@@ -57,7 +59,7 @@ class ContextMetadata:
     total_relations: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class ContextResult:
     """Complete context result with metadata."""
 
@@ -143,14 +145,11 @@ class ContextService:
         logger.debug(f"Found {len(related)} related results")
 
         # Collect entity IDs from primary and related results
-        entity_ids = []
-        for result in primary:
-            if result.type == SearchItemType.ENTITY.value:
-                entity_ids.append(result.id)
-
-        for result in related:
-            if result.type == SearchItemType.ENTITY.value:
-                entity_ids.append(result.id)
+        entity_ids = [
+            result.id
+            for result in chain(primary, related)
+            if result.type == SearchItemType.ENTITY.value
+        ]
 
         # Fetch observations for all entities if requested
         observations_by_entity = {}
@@ -172,48 +171,151 @@ class ContextService:
         )
 
         # Build context results list directly with ContextResultItem objects
-        context_results = []
-
-        # For each primary result
-        for primary_item in primary:
-            # Find all related items with this primary item as root
-            related_to_primary = [r for r in related if r.root_id == primary_item.id]
-
-            # Get observations for this item if it's an entity
-            item_observations = []
-            if primary_item.type == SearchItemType.ENTITY.value and include_observations:
-                # Convert Observation models to ContextResultRows
-                for obs in observations_by_entity.get(primary_item.id, []):
-                    item_observations.append(
-                        ContextResultRow(
-                            type="observation",
-                            id=obs.id,
-                            title=f"{obs.category}: {obs.content[:50]}...",
-                            permalink=generate_permalink(
-                                f"{primary_item.permalink}/observations/{obs.category}/{obs.content}"
-                            ),
-                            file_path=primary_item.file_path,
-                            content=obs.content,
-                            category=obs.category,
-                            entity_id=primary_item.id,
-                            depth=0,
-                            root_id=primary_item.id,
-                            created_at=primary_item.created_at,  # created_at time from entity
-                        )
-                    )
-
-            # Create ContextResultItem directly
-            context_item = ContextResultItem(
-                primary_result=primary_item,
-                observations=item_observations,
-                related_results=related_to_primary,
+        context_results = [
+            self._build_context_item(
+                primary_item, related, observations_by_entity, include_observations
             )
-
-            context_results.append(context_item)
+            for primary_item in primary
+        ]
 
         # Return the structured ContextResult
         return ContextResult(results=context_results, metadata=metadata)
 
+    async def build_context_batch(
+        self,
+        permalinks: List[str],
+        depth: int = 1,
+        since: Optional[datetime] = None,
+        limit=10,
+        max_related: int = 10,
+        include_observations: bool = True,
+    ) -> Dict[str, ContextResult]:
+        """Build context for several exact permalinks with shared lookups.
+
+        Produces the same results as calling build_context() for each permalink,
+        but primary items and observations are each loaded with a single query.
+        Related items are still traversed per permalink so max_related applies to
+        each one separately.
+
+        Returns:
+            Mapping of each requested permalink to its ContextResult
+        """
+        logger.debug(
+            f"Building context for {len(permalinks)} permalinks depth: '{depth}' since: '{since}'"
+        )
+
+        normalized_paths = {
+            permalink: generate_permalink(memory_url_path(permalink), split_extension=False)
+            for permalink in permalinks
+        }
+        unique_paths = list(dict.fromkeys(normalized_paths.values()))
+        if not unique_paths:
+            return {}
+
+        # Single lookup for the primary items of every permalink
+        rows = await self.search_repository.search(
+            permalinks=unique_paths, limit=limit * len(unique_paths)
+        )
+        primary_by_path: Dict[str, List[SearchIndexRow]] = {path: [] for path in unique_paths}
+        for row in rows:
+            matches = primary_by_path.get(row.permalink)
+            if matches is not None and len(matches) < limit:
+                matches.append(row)
+
+        # Traverse relations per permalink so each keeps its own max_related budget
+        related_by_path: Dict[str, List[ContextResultRow]] = {}
+        for path, primary in primary_by_path.items():
+            related_by_path[path] = await self.find_related(
+                [(r.type, r.id) for r in primary],
+                max_depth=depth,
+                since=since,
+                max_results=max_related,
+            )
+
+        # Fetch observations for every entity across all permalinks at once
+        observations_by_entity = {}
+        if include_observations:
+            entity_ids = {
+                result.id
+                for path in unique_paths
+                for result in [*primary_by_path[path], *related_by_path[path]]
+                if result.type == SearchItemType.ENTITY.value
+            }
+            if entity_ids:
+                observations_by_entity = await self.observation_repository.find_by_entities(
+                    list(entity_ids)
+                )
+
+        context_by_path: Dict[str, ContextResult] = {}
+        for path in unique_paths:
+            primary = primary_by_path[path]
+            related = related_by_path[path]
+            entity_ids = {
+                r.id for r in [*primary, *related] if r.type == SearchItemType.ENTITY.value
+            }
+            metadata = ContextMetadata(
+                uri=path,
+                depth=depth,
+                timeframe=since.isoformat() if since else None,
+                primary_count=len(primary),
+                related_count=len(related),
+                total_observations=sum(
+                    len(observations_by_entity.get(entity_id, [])) for entity_id in entity_ids
+                ),
+                total_relations=sum(1 for r in related if r.type == SearchItemType.RELATION),
+            )
+            context_by_path[path] = ContextResult(
+                results=[
+                    self._build_context_item(
+                        primary_item, related, observations_by_entity, include_observations
+                    )
+                    for primary_item in primary
+                ],
+                metadata=metadata,
+            )
+
+        return {permalink: context_by_path[path] for permalink, path in normalized_paths.items()}
+
+    def _build_context_item(
+        self,
+        primary_item: SearchIndexRow,
+        related: List[ContextResultRow],
+        observations_by_entity: Dict[int, List[Observation]],
+        include_observations: bool,
+    ) -> ContextResultItem:
+        """Assemble the hierarchical result for one primary item."""
+        # Find all related items with this primary item as root
+        related_to_primary = [r for r in related if r.root_id == primary_item.id]
+
+        # Get observations for this item if it's an entity
+        item_observations = []
+        if primary_item.type == SearchItemType.ENTITY.value and include_observations:
+            # Convert Observation models to ContextResultRows
+            item_observations = [
+                ContextResultRow(
+                    type="observation",
+                    id=obs.id,
+                    title=f"{obs.category}: {obs.content[:50]}...",
+                    permalink=generate_permalink(
+                        f"{primary_item.permalink}/observations/{obs.category}/{obs.content}"
+                    ),
+                    file_path=primary_item.file_path,
+                    content=obs.content,
+                    category=obs.category,
+                    entity_id=primary_item.id,
+                    depth=0,
+                    root_id=primary_item.id,
+                    created_at=primary_item.created_at,  # created_at time from entity
+                )
+                for obs in observations_by_entity.get(primary_item.id, [])
+            ]
+
+        return ContextResultItem(
+            primary_result=primary_item,
+            observations=item_observations,
+            related_results=related_to_primary,
+        )
+
     async def find_related(
         self,
         type_id_pairs: List[Tuple[str, int]],
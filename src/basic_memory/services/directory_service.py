@@ -2,7 +2,7 @@
 
 import fnmatch
 import logging
-import os
+from collections import defaultdict
 from typing import Dict, List, Optional, Sequence
 
 from basic_memory.models import Entity
@@ -26,66 +26,73 @@ class DirectoryService:
     async def get_directory_tree(self) -> DirectoryNode:
         """Build a hierarchical directory tree from indexed files."""
 
-        # Get all files from DB (flat list)
-        entity_rows = await self.entity_repository.find_all()
+        # Get all files from DB (flat list). Only entity columns are needed, so skip the
+        # eager loading of observations and relations and fetch everything in one query
+        entity_rows = await self.entity_repository.find_all(use_load_options=False)
 
         # Create a root directory node
-        root_node = DirectoryNode(name="Root", directory_path="/", type="directory")
+        # Node fields come straight from the database, so build nodes with
+        # model_construct() and skip per-node pydantic validation
+        root_node = DirectoryNode.model_construct(name="Root", directory_path="/", type="directory")
 
         # Map to store directory nodes by path for easy lookup
         dir_map: Dict[str, DirectoryNode] = {root_node.directory_path: root_node}
 
-        # First pass: create all directory nodes
-        for file in entity_rows:
-            # Process directory path components
-            parts = [p for p in file.file_path.split("/") if p]
-
-            # Create directory structure
-            current_path = "/"
-            for i, part in enumerate(parts[:-1]):  # Skip the filename
-                parent_path = current_path
-                # Build the directory path
-                current_path = (
-                    f"{current_path}{part}" if current_path == "/" else f"{current_path}/{part}"
-                )
-
-                # Create directory node if it doesn't exist
-                if current_path not in dir_map:
-                    dir_node = DirectoryNode(
-                        name=part, directory_path=current_path, type="directory"
-                    )
-                    dir_map[current_path] = dir_node
-
-                    # Add to parent's children
-                    if parent_path in dir_map:
-                        dir_map[parent_path].children.append(dir_node)
+        # File nodes grouped by their parent directory path, so they can be added after
+        # each directory's subdirectories once every directory node exists
+        files_by_dir: Dict[str, List[DirectoryNode]] = defaultdict(list)
 
-        # Second pass: add file nodes to their parent directories
+        # Single pass: create directory nodes and file nodes
         for file in entity_rows:
-            file_name = os.path.basename(file.file_path)
-            parent_dir = os.path.dirname(file.file_path)
+            parent_dir, _, file_name = file.file_path.rpartition("/")
             directory_path = "/" if parent_dir == "" else f"/{parent_dir}"
 
+            # Most files share a directory with an earlier file. Once a directory node
+            # exists, so do all of its ancestors, so only walk the path for new ones
+            if directory_path not in dir_map:
+                # Create directory structure, tracking the parent node as we walk down
+                # Paths are built as "/a", "/a/b", so start from the empty prefix
+                current_path = ""
+                parent_node = root_node
+                for part in [p for p in parent_dir.split("/") if p]:
+                    # Build the directory path
+                    current_path = f"{current_path}/{part}"
+
+                    # Create directory node if it doesn't exist (single dict lookup)
+                    dir_node = dir_map.get(current_path)
+                    if dir_node is None:
+                        dir_node = DirectoryNode.model_construct(
+                            name=part, directory_path=current_path, type="directory"
+                        )
+                        dir_map[current_path] = dir_node
+
+                        # Add to parent's children
+                        parent_node.children.append(dir_node)
+                    parent_node = dir_node
+
+                # If the parent directory still doesn't exist (should be rare), add to root
+                if directory_path not in dir_map:
+                    directory_path = root_node.directory_path  # pragma: no cover
+
             # Create file node
-            file_node = DirectoryNode(
-                name=file_name,
-                file_path=file.file_path,  # Original path from DB (no leading slash)
-                directory_path=f"/{file.file_path}",  # Path with leading slash
-                type="file",
-                title=file.title,
-                permalink=file.permalink,
-                entity_id=file.id,
-                entity_type=file.entity_type,
-                content_type=file.content_type,
-                updated_at=file.updated_at,
+            files_by_dir[directory_path].append(
+                DirectoryNode.model_construct(
+                    name=file_name,
+                    file_path=file.file_path,  # Original path from DB (no leading slash)
+                    directory_path=f"/{file.file_path}",  # Path with leading slash
+                    type="file",
+                    title=file.title,
+                    permalink=file.permalink,
+                    entity_id=file.id,
+                    entity_type=file.entity_type,
+                    content_type=file.content_type,
+                    updated_at=file.updated_at,
+                )
             )
 
-            # Add to parent directory's children
-            if directory_path in dir_map:
-                dir_map[directory_path].children.append(file_node)
-            else:
-                # If parent directory doesn't exist (should be rare), add to root
-                dir_map["/"].children.append(file_node)  # pragma: no cover
+        # Add file nodes to their parent directories, after the subdirectories
+        for directory_path, file_nodes in files_by_dir.items():
+            dir_map[directory_path].children.extend(file_nodes)
 
         # Return the root node with its children
         return root_node
@@ -103,7 +110,7 @@ class DirectoryService:
         directories = await self.entity_repository.get_distinct_directories()
 
         # Create a root directory node
-        root_node = DirectoryNode(name="Root", directory_path="/", type="directory")
+        root_node = DirectoryNode.model_construct(name="Root", directory_path="/", type="directory")
 
         # Map to store directory nodes by path for easy lookup
         dir_map: Dict[str, DirectoryNode] = {"/": root_node}
@@ -111,25 +118,24 @@ class DirectoryService:
         # Build tree with just folders
         for dir_path in directories:
             parts = [p for p in dir_path.split("/") if p]
-            current_path = "/"
+            current_path = ""
 
-            for i, part in enumerate(parts):
-                parent_path = current_path
+            parent_node = root_node
+            for part in parts:
                 # Build the directory path
-                current_path = (
-                    f"{current_path}{part}" if current_path == "/" else f"{current_path}/{part}"
-                )
+                current_path = f"{current_path}/{part}"
 
-                # Create directory node if it doesn't exist
-                if current_path not in dir_map:
-                    dir_node = DirectoryNode(
+                # Create directory node if it doesn't exist (single dict lookup)
+                dir_node = dir_map.get(current_path)
+                if dir_node is None:
+                    dir_node = DirectoryNode.model_construct(
                         name=part, directory_path=current_path, type="directory"
                     )
                     dir_map[current_path] = dir_node
 
                     # Add to parent's children
-                    if parent_path in dir_map:
-                        dir_map[parent_path].children.append(dir_node)
+                    parent_node.children.append(dir_node)
+                parent_node = dir_node
 
         return root_node
 
@@ -162,18 +168,24 @@ class DirectoryService:
         if dir_name != "/" and dir_name.endswith("/"):
             dir_name = dir_name.rstrip("/")
 
-        # Optimize: Query only entities in the target directory
-        # instead of loading the entire tree
-        dir_prefix = dir_name.lstrip("/")
-        entity_rows = await self.entity_repository.find_by_directory_prefix(dir_prefix)
-
-        # Build a partial tree from only the relevant entities
-        root_tree = self._build_directory_tree_from_entities(entity_rows, dir_name)
-
-        # Find the target directory node
-        target_node = self._find_directory_node(root_tree, dir_name)
-        if not target_node:
-            return []
+        if dir_name == "/":
+            # Root listing: every entity is in scope and the tree root is the target,
+            # so skip the prefix query dispatch and the search for the target node
+            entity_rows = await self.entity_repository.find_all(use_load_options=False)
+            target_node = self._build_directory_tree_from_entities(entity_rows, dir_name)
+        else:
+            # Optimize: Query only entities in the target directory
+            # instead of loading the entire tree
+            dir_prefix = dir_name.lstrip("/")
+            entity_rows = await self.entity_repository.find_by_directory_prefix(dir_prefix)
+
+            # Build a partial tree from only the relevant entities
+            root_tree = self._build_directory_tree_from_entities(entity_rows, dir_name)
+
+            # Find the target directory node
+            target_node = self._find_directory_node(root_tree, dir_name)
+            if not target_node:
+                return []
 
         # Collect nodes with depth and glob filtering
         result = []
@@ -194,62 +206,69 @@ class DirectoryService:
             DirectoryNode representing the tree root
         """
         # Create a root directory node
-        root_node = DirectoryNode(name="Root", directory_path=root_path, type="directory")
+        root_node = DirectoryNode.model_construct(
+            name="Root", directory_path=root_path, type="directory"
+        )
 
         # Map to store directory nodes by path for easy lookup
         dir_map: Dict[str, DirectoryNode] = {root_path: root_node}
 
-        # First pass: create all directory nodes
-        for file in entity_rows:
-            # Process directory path components
-            parts = [p for p in file.file_path.split("/") if p]
+        # File nodes grouped by their parent directory path, so they can be added after
+        # each directory's subdirectories once every directory node exists
+        files_by_dir: Dict[str, List[DirectoryNode]] = defaultdict(list)
 
-            # Create directory structure
-            current_path = "/"
-            for i, part in enumerate(parts[:-1]):  # Skip the filename
-                parent_path = current_path
-                # Build the directory path
-                current_path = (
-                    f"{current_path}{part}" if current_path == "/" else f"{current_path}/{part}"
-                )
-
-                # Create directory node if it doesn't exist
-                if current_path not in dir_map:
-                    dir_node = DirectoryNode(
-                        name=part, directory_path=current_path, type="directory"
-                    )
-                    dir_map[current_path] = dir_node
-
-                    # Add to parent's children
-                    if parent_path in dir_map:
-                        dir_map[parent_path].children.append(dir_node)
-
-        # Second pass: add file nodes to their parent directories
+        # Single pass: create directory nodes and file nodes
         for file in entity_rows:
-            file_name = os.path.basename(file.file_path)
-            parent_dir = os.path.dirname(file.file_path)
+            parent_dir, _, file_name = file.file_path.rpartition("/")
             directory_path = "/" if parent_dir == "" else f"/{parent_dir}"
 
+            # Most files share a directory with an earlier file. Once a directory node
+            # exists, so do all of its ancestors, so only walk the path for new ones
+            if directory_path not in dir_map:
+                # Create directory structure, tracking the parent node as we walk down.
+                # Directories above root_path are not in dir_map, so they have no parent node
+                current_path = ""
+                parent_node = dir_map.get("/")
+                for part in [p for p in parent_dir.split("/") if p]:
+                    # Build the directory path
+                    current_path = f"{current_path}/{part}"
+
+                    # Create directory node if it doesn't exist (single dict lookup)
+                    dir_node = dir_map.get(current_path)
+                    if dir_node is None:
+                        dir_node = DirectoryNode.model_construct(
+                            name=part, directory_path=current_path, type="directory"
+                        )
+                        dir_map[current_path] = dir_node
+
+                        # Add to parent's children
+                        if parent_node is not None:
+                            parent_node.children.append(dir_node)
+                    parent_node = dir_node
+
+                # If the parent directory still doesn't exist (should be rare), add to root
+                if directory_path not in dir_map:
+                    directory_path = root_node.directory_path
+
             # Create file node
-            file_node = DirectoryNode(
-                name=file_name,
-                file_path=file.file_path,
-                directory_path=f"/{file.file_path}",
-                type="file",
-                title=file.title,
-                permalink=file.permalink,
-                entity_id=file.id,
-                entity_type=file.entity_type,
-                content_type=file.content_type,
-                updated_at=file.updated_at,
+            files_by_dir[directory_path].append(
+                DirectoryNode.model_construct(
+                    name=file_name,
+                    file_path=file.file_path,
+                    directory_path=f"/{file.file_path}",
+                    type="file",
+                    title=file.title,
+                    permalink=file.permalink,
+                    entity_id=file.id,
+                    entity_type=file.entity_type,
+                    content_type=file.content_type,
+                    updated_at=file.updated_at,
+                )
             )
 
-            # Add to parent directory's children
-            if directory_path in dir_map:
-                dir_map[directory_path].children.append(file_node)
-            elif root_path in dir_map:
-                # Fallback to root if parent not found
-                dir_map[root_path].children.append(file_node)
+        # Add file nodes to their parent directories, after the subdirectories
+        for directory_path, file_nodes in files_by_dir.items():
+            dir_map[directory_path].children.extend(file_nodes)
 
         return root_node
 
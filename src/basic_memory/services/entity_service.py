@@ -77,8 +77,9 @@ class EntityService(BaseService[EntityModel]):
 
         conflicts = []
 
-        # Get all existing file paths
-        all_entities = await self.repository.find_all()
+        # Get all existing file paths. Only entity columns are used, so skip eager
+        # loading every entity's observations and relations
+        all_entities = await self.repository.find_all(use_load_options=False)
         existing_paths = [entity.file_path for entity in all_entities]
 
         # Use the enhanced conflict detection utility
@@ -25,6 +25,85 @@ from basic_memory.utils import generate_permalink
 
 config = ConfigManager().config
 
+# Static statistics statements, built once so each call reuses the same TextClause
+ENTITY_TYPE_COUNTS = text(
+    "SELECT entity_type, COUNT(*) FROM entity WHERE project_id = :project_id GROUP BY entity_type"
+)
+
+OBSERVATION_CATEGORY_COUNTS = text(
+    "SELECT o.category, COUNT(*) FROM observation o JOIN entity e ON o.entity_id = e.id WHERE e.project_id = :project_id GROUP BY o.category"
+)
+
+RELATION_TYPE_COUNTS = text(
+    "SELECT r.relation_type, COUNT(*), SUM(r.to_id IS NULL) FROM relation r JOIN entity e ON r.from_id = e.id WHERE e.project_id = :project_id GROUP BY r.relation_type"
+)
+
+MOST_CONNECTED_ENTITIES = text("""
+    SELECT e.id, e.title, e.permalink, COUNT(r.id) AS relation_count, e.file_path
+    FROM entity e
+    JOIN relation r ON e.id = r.from_id
+    WHERE e.project_id = :project_id
+    GROUP BY e.id
+    ORDER BY relation_count DESC
+    LIMIT 10
+""")
+
+ISOLATED_ENTITY_COUNT = text("""
+    SELECT COUNT(e.id)
+    FROM entity e
+    LEFT JOIN relation r1 ON e.id = r1.from_id
+    LEFT JOIN relation r2 ON e.id = r2.to_id
+    WHERE e.project_id = :project_id AND r1.id IS NULL AND r2.id IS NULL
+""")
+
+RECENTLY_CREATED_ENTITIES = text("""
+    SELECT id, title, permalink, entity_type, created_at, file_path
+    FROM entity
+    WHERE project_id = :project_id
+    ORDER BY created_at DESC
+    LIMIT 10
+""")
+
+RECENTLY_UPDATED_ENTITIES = text("""
+    SELECT id, title, permalink, entity_type, updated_at, file_path
+    FROM entity
+    WHERE project_id = :project_id
+    ORDER BY updated_at DESC
+    LIMIT 10
+""")
+
+ENTITY_GROWTH_BY_MONTH = text("""
+    SELECT
+        strftime('%Y-%m', created_at) AS month,
+        COUNT(*) AS count
+    FROM entity
+    WHERE created_at >= :six_months_ago AND project_id = :project_id
+    GROUP BY month
+    ORDER BY month
+""")
+
+OBSERVATION_GROWTH_BY_MONTH = text("""
+    SELECT
+        strftime('%Y-%m', entity.created_at) AS month,
+        COUNT(*) AS count
+    FROM observation
+    INNER JOIN entity ON observation.entity_id = entity.id
+    WHERE entity.created_at >= :six_months_ago AND entity.project_id = :project_id
+    GROUP BY month
+    ORDER BY month
+""")
+
+RELATION_GROWTH_BY_MONTH = text("""
+    SELECT
+        strftime('%Y-%m', entity.created_at) AS month,
+        COUNT(*) AS count
+    FROM relation
+    INNER JOIN entity ON relation.from_id = entity.id
+    WHERE entity.created_at >= :six_months_ago AND entity.project_id = :project_id
+    GROUP BY month
+    ORDER BY month
+""")
+
 
 class ProjectService:
     """Service for managing Basic Memory projects."""
@@ -547,17 +626,18 @@ class ProjectService:
         if not db_project:  # pragma: no cover
             raise ValueError(f"Project '{project_name}' not found in database")
 
-        # Get statistics for the specified project
-        statistics = await self.get_statistics(db_project.id)
-
-        # Get activity metrics for the specified project
-        activity = await self.get_activity_metrics(db_project.id)
+        # Get statistics, activity metrics and the active projects concurrently;
+        # the queries are independent reads, so their round trips can overlap
+        statistics, activity, db_projects = await asyncio.gather(
+            self.get_statistics(db_project.id),
+            self.get_activity_metrics(db_project.id),
+            self.repository.get_active_projects(),
+        )
 
         # Get system status
         system = self.get_system_status()
 
         # Get enhanced project information from database
-        db_projects = await self.repository.get_active_projects()
         db_projects_by_permalink = {p.permalink: p for p in db_projects}
 
         # Get default project info
@@ -596,97 +676,46 @@ class ProjectService:
         if not self.repository:  # pragma: no cover
             raise ValueError("Repository is required for get_statistics")
 
-        # Get basic counts
-        entity_count_result = await self.repository.execute_query(
-            text("SELECT COUNT(*) FROM entity WHERE project_id = :project_id"),
-            {"project_id": project_id},
-        )
-        total_entities = entity_count_result.scalar() or 0
-
-        observation_count_result = await self.repository.execute_query(
-            text(
-                "SELECT COUNT(*) FROM observation o JOIN entity e ON o.entity_id = e.id WHERE e.project_id = :project_id"
-            ),
-            {"project_id": project_id},
-        )
-        total_observations = observation_count_result.scalar() or 0
-
-        relation_count_result = await self.repository.execute_query(
-            text(
-                "SELECT COUNT(*) FROM relation r JOIN entity e ON r.from_id = e.id WHERE e.project_id = :project_id"
-            ),
-            {"project_id": project_id},
-        )
-        total_relations = relation_count_result.scalar() or 0
-
-        unresolved_count_result = await self.repository.execute_query(
-            text(
-                "SELECT COUNT(*) FROM relation r JOIN entity e ON r.from_id = e.id WHERE r.to_id IS NULL AND e.project_id = :project_id"
-            ),
-            {"project_id": project_id},
-        )
-        total_unresolved = unresolved_count_result.scalar() or 0
-
-        # Get entity counts by type
+        # Get entity counts by type; the total is the sum of the groups, so no
+        # separate COUNT(*) query is needed
         entity_types_result = await self.repository.execute_query(
-            text(
-                "SELECT entity_type, COUNT(*) FROM entity WHERE project_id = :project_id GROUP BY entity_type"
-            ),
+            ENTITY_TYPE_COUNTS,
             {"project_id": project_id},
         )
-        entity_types = {row[0]: row[1] for row in entity_types_result.fetchall()}
+        entity_types = dict(entity_types_result.tuples().all())
+        total_entities = sum(entity_types.values())
 
         # Get observation counts by category
         category_result = await self.repository.execute_query(
-            text(
-                "SELECT o.category, COUNT(*) FROM observation o JOIN entity e ON o.entity_id = e.id WHERE e.project_id = :project_id GROUP BY o.category"
-            ),
+            OBSERVATION_CATEGORY_COUNTS,
             {"project_id": project_id},
         )
-        observation_categories = {row[0]: row[1] for row in category_result.fetchall()}
+        observation_categories = dict(category_result.tuples().all())
+        total_observations = sum(observation_categories.values())
 
-        # Get relation counts by type
+        # Get relation counts by type, counting unresolved relations in the same pass
         relation_types_result = await self.repository.execute_query(
-            text(
-                "SELECT r.relation_type, COUNT(*) FROM relation r JOIN entity e ON r.from_id = e.id WHERE e.project_id = :project_id GROUP BY r.relation_type"
-            ),
+            RELATION_TYPE_COUNTS,
             {"project_id": project_id},
         )
-        relation_types = {row[0]: row[1] for row in relation_types_result.fetchall()}
+        relation_types = {}
+        total_unresolved = 0
+        for relation_type, count, unresolved in relation_types_result.fetchall():
+            relation_types[relation_type] = count
+            total_unresolved += unresolved or 0
+        total_relations = sum(relation_types.values())
 
         # Find most connected entities (most outgoing relations) - project filtered
         connected_result = await self.repository.execute_query(
-            text("""
-            SELECT e.id, e.title, e.permalink, COUNT(r.id) AS relation_count, e.file_path
-            FROM entity e
-            JOIN relation r ON e.id = r.from_id
-            WHERE e.project_id = :project_id
-            GROUP BY e.id
-            ORDER BY relation_count DESC
-            LIMIT 10
-        """),
+            MOST_CONNECTED_ENTITIES,
             {"project_id": project_id},
         )
-        most_connected = [
-            {
-                "id": row[0],
-                "title": row[1],
-                "permalink": row[2],
-                "relation_count": row[3],
-                "file_path": row[4],
-            }
-            for row in connected_result.fetchall()
-        ]
+        # Dict keys come from the SELECT column names
+        most_connected = [dict(row) for row in connected_result.mappings()]
 
         # Count isolated entities (no relations) - project filtered
         isolated_result = await self.repository.execute_query(
-            text("""
-            SELECT COUNT(e.id)
-            FROM entity e
-            LEFT JOIN relation r1 ON e.id = r1.from_id
-            LEFT JOIN relation r2 ON e.id = r2.to_id
-            WHERE e.project_id = :project_id AND r1.id IS NULL AND r2.id IS NULL
-        """),
+            ISOLATED_ENTITY_COUNT,
             {"project_id": project_id},
         )
         isolated_count = isolated_result.scalar() or 0
@@ -714,49 +743,17 @@ class ProjectService:
 
         # Get recently created entities (project filtered)
         created_result = await self.repository.execute_query(
-            text("""
-            SELECT id, title, permalink, entity_type, created_at, file_path 
-            FROM entity
-            WHERE project_id = :project_id
-            ORDER BY created_at DESC
-            LIMIT 10
-        """),
+            RECENTLY_CREATED_ENTITIES,
             {"project_id": project_id},
         )
-        recently_created = [
-            {
-                "id": row[0],
-                "title": row[1],
-                "permalink": row[2],
-                "entity_type": row[3],
-                "created_at": row[4],
-                "file_path": row[5],
-            }
-            for row in created_result.fetchall()
-        ]
+        recently_created = [dict(row) for row in created_result.mappings()]
 
         # Get recently updated entities (project filtered)
         updated_result = await self.repository.execute_query(
-            text("""
-            SELECT id, title, permalink, entity_type, updated_at, file_path 
-            FROM entity
-            WHERE project_id = :project_id
-            ORDER BY updated_at DESC
-            LIMIT 10
-        """),
+            RECENTLY_UPDATED_ENTITIES,
             {"project_id": project_id},
         )
-        recently_updated = [
-            {
-                "id": row[0],
-                "title": row[1],
-                "permalink": row[2],
-                "entity_type": row[3],
-                "updated_at": row[4],
-                "file_path": row[5],
-            }
-            for row in updated_result.fetchall()
-        ]
+        recently_updated = [dict(row) for row in updated_result.mappings()]
 
         # Get monthly growth over the last 6 months
         # Calculate the start of 6 months ago
@@ -767,50 +764,24 @@ class ProjectService:
 
         # Query for monthly entity creation (project filtered)
         entity_growth_result = await self.repository.execute_query(
-            text("""
-            SELECT 
-                strftime('%Y-%m', created_at) AS month,
-                COUNT(*) AS count
-            FROM entity
-            WHERE created_at >= :six_months_ago AND project_id = :project_id
-            GROUP BY month
-            ORDER BY month
-        """),
+            ENTITY_GROWTH_BY_MONTH,
             {"six_months_ago": six_months_ago.isoformat(), "project_id": project_id},
         )
-        entity_growth = {row[0]: row[1] for row in entity_growth_result.fetchall()}
+        entity_growth = dict(entity_growth_result.tuples().all())
 
         # Query for monthly observation creation (project filtered)
         observation_growth_result = await self.repository.execute_query(
-            text("""
-            SELECT 
-                strftime('%Y-%m', entity.created_at) AS month,
-                COUNT(*) AS count
-            FROM observation
-            INNER JOIN entity ON observation.entity_id = entity.id
-            WHERE entity.created_at >= :six_months_ago AND entity.project_id = :project_id
-            GROUP BY month
-            ORDER BY month
-        """),
+            OBSERVATION_GROWTH_BY_MONTH,
             {"six_months_ago": six_months_ago.isoformat(), "project_id": project_id},
         )
-        observation_growth = {row[0]: row[1] for row in observation_growth_result.fetchall()}
+        observation_growth = dict(observation_growth_result.tuples().all())
 
         # Query for monthly relation creation (project filtered)
         relation_growth_result = await self.repository.execute_query(
-            text("""
-            SELECT 
-                strftime('%Y-%m', entity.created_at) AS month,
-                COUNT(*) AS count
-            FROM relation
-            INNER JOIN entity ON relation.from_id = entity.id
-            WHERE entity.created_at >= :six_months_ago AND entity.project_id = :project_id
-            GROUP BY month
-            ORDER BY month
-        """),
+            RELATION_GROWTH_BY_MONTH,
             {"six_months_ago": six_months_ago.isoformat(), "project_id": project_id},
         )
-        relation_growth = {row[0]: row[1] for row in relation_growth_result.fetchall()}
+        relation_growth = dict(relation_growth_result.tuples().all())
 
         # Combine all monthly growth data
         monthly_growth = {}
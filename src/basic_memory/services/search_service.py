@@ -4,7 +4,6 @@ import ast
 from datetime import datetime
 from typing import List, Optional, Set
 
-from dateparser import parse
 from fastapi import BackgroundTasks
 from loguru import logger
 from sqlalchemy import text
@@ -12,6 +11,7 @@ from sqlalchemy import text
 from basic_memory.models import Entity
 from basic_memory.repository import EntityRepository
 from basic_memory.repository.search_repository import SearchRepository, SearchIndexRow
+from basic_memory.schemas.base import parse_datetime
 from basic_memory.schemas.search import SearchQuery, SearchItemType
 from basic_memory.services import FileService
 
@@ -53,6 +53,9 @@ class SearchService:
         for entity in entities:
             await self.index_entity(entity, background_tasks)
 
+        # Merge the segments written by the per-entity inserts
+        await self.repository.optimize_search_index()
+
         logger.info("Reindex complete")
 
     async def search(self, query: SearchQuery, limit=10, offset=0) -> List[SearchIndexRow]:
@@ -73,7 +76,7 @@ class SearchService:
             (
                 query.after_date
                 if isinstance(query.after_date, datetime)
-                else parse(query.after_date)
+                else parse_datetime(query.after_date)
             )
             if query.after_date
             else None
@@ -5,7 +5,7 @@ import os
 from collections import defaultdict
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional, Set, Sequence
+from typing import TYPE_CHECKING, List, Optional, Set, Sequence
 
 from basic_memory.config import BasicMemoryConfig, WATCH_STATUS_JSON
 from basic_memory.ignore_utils import load_gitignore_patterns, should_ignore_path
@@ -18,6 +18,9 @@ from watchfiles import awatch
 from watchfiles.main import FileChange, Change
 import time
 
+if TYPE_CHECKING:  # pragma: no cover
+    from basic_memory.sync.sync_service import SyncService
+
 
 class WatchEvent(BaseModel):
     timestamp: datetime
@@ -84,6 +87,7 @@ class WatchService:
         self.status_path = Path.home() / ".basic-memory" / WATCH_STATUS_JSON
         self.status_path.parent.mkdir(parents=True, exist_ok=True)
         self._ignore_patterns_cache: dict[Path, Set[str]] = {}
+        self._sync_service_cache: dict[int, "SyncService"] = {}
 
         # quiet mode for mcp so it doesn't mess up stdout
         self.console = Console(quiet=quiet)
@@ -99,6 +103,21 @@ class WatchService:
             self._ignore_patterns_cache[project_path] = load_gitignore_patterns(project_path)
         return self._ignore_patterns_cache[project_path]
 
+    async def _get_sync_service(self, project: Project) -> "SyncService":
+        """Get or create the sync service for a project.
+
+        Building a sync service wires up repositories and services and reads .bmignore,
+        so reuse it for every batch of changes in a watch cycle.
+        """
+        # avoid circular imports
+        from basic_memory.sync.sync_service import get_sync_service
+
+        sync_service = self._sync_service_cache.get(project.id)
+        if sync_service is None:
+            sync_service = await get_sync_service(project)
+            self._sync_service_cache[project.id] = sync_service
+        return sync_service
+
     async def _watch_projects_cycle(self, projects: Sequence[Project], stop_event: asyncio.Event):
         """Run one cycle of watching the given projects until stop_event is set."""
         project_paths = [project.path for project in projects]
@@ -156,6 +175,9 @@ class WatchService:
                 # Clear ignore patterns cache to pick up any .gitignore changes
                 self._ignore_patterns_cache.clear()
 
+                # Rebuild sync services so project path and .bmignore changes are picked up
+                self._sync_service_cache.clear()
+
                 # Reload projects to catch any new/removed projects
                 projects = await self.project_repository.get_active_projects()
 
@@ -233,9 +255,6 @@ class WatchService:
 
     async def handle_changes(self, project: Project, changes: Set[FileChange]) -> None:
         """Process a batch of file changes"""
-        # avoid circular imports
-        from basic_memory.sync.sync_service import get_sync_service
-
         # Check if project still exists in configuration before processing
         # This prevents deleted projects from being recreated by background sync
         from basic_memory.config import ConfigManager
@@ -250,7 +269,7 @@ class WatchService:
             )
             return
 
-        sync_service = await get_sync_service(project)
+        sync_service = await self._get_sync_service(project)
         file_service = sync_service.file_service
 
         start_time = time.time()
@@ -5,6 +5,7 @@ import os
 import logging
 import re
 import sys
+import unicodedata
 from datetime import datetime
 from pathlib import Path
 from typing import Optional, Protocol, Union, runtime_checkable, List
@@ -330,8 +331,6 @@ def normalize_file_path_for_comparison(file_path: str) -> str:
     Returns:
         Normalized file path for comparison purposes
     """
-    import unicodedata
-
     # Convert to lowercase for case-insensitive comparison
     normalized = file_path.lower()
 
@@ -68,10 +68,9 @@ def context_without_results():
     }
 
 
-@pytest.mark.asyncio
-async def test_continue_conversation_with_results(template_loader, context_with_results):
+def test_continue_conversation_with_results(template_loader, context_with_results):
     """Test rendering the continue_conversation template with results."""
-    result = await template_loader.render("prompts/continue_conversation.hbs", context_with_results)
+    result = template_loader.render("prompts/continue_conversation.hbs", context_with_results)
 
     # Check that key elements are present
     assert "Continuing conversation on: Test Topic" in result
@@ -84,12 +83,9 @@ async def test_continue_conversation_with_results(template_loader, context_with_
     assert "Knowledge Capture Recommendation" in result
 
 
-@pytest.mark.asyncio
-async def test_continue_conversation_without_results(template_loader, context_without_results):
+def test_continue_conversation_without_results(template_loader, context_without_results):
     """Test rendering the continue_conversation template without results."""
-    result = await template_loader.render(
-        "prompts/continue_conversation.hbs", context_without_results
-    )
+    result = template_loader.render("prompts/continue_conversation.hbs", context_without_results)
 
     # Check that key elements are present
     assert "Continuing conversation on: Empty Topic" in result
@@ -100,10 +96,9 @@ async def test_continue_conversation_without_results(template_loader, context_wi
     assert "Knowledge Capture Recommendation" in result
 
 
-@pytest.mark.asyncio
-async def test_next_steps_section(template_loader, context_with_results):
+def test_next_steps_section(template_loader, context_with_results):
     """Test that the next steps section is rendered correctly."""
-    result = await template_loader.render("prompts/continue_conversation.hbs", context_with_results)
+    result = template_loader.render("prompts/continue_conversation.hbs", context_with_results)
 
     assert "Next Steps" in result
     assert 'Explore more with: `search_notes("Test Topic")`' in result
@@ -114,10 +109,9 @@ async def test_next_steps_section(template_loader, context_with_results):
     assert "Record new learnings or decisions from this conversation" in result
 
 
-@pytest.mark.asyncio
-async def test_knowledge_capture_recommendation(template_loader, context_with_results):
+def test_knowledge_capture_recommendation(template_loader, context_with_results):
     """Test that the knowledge capture recommendation is rendered."""
-    result = await template_loader.render("prompts/continue_conversation.hbs", context_with_results)
+    result = template_loader.render("prompts/continue_conversation.hbs", context_with_results)
 
     assert "Knowledge Capture Recommendation" in result
     assert "actively look for opportunities to:" in result
@@ -127,16 +121,13 @@ async def test_knowledge_capture_recommendation(template_loader, context_with_re
     assert "one of the most valuable aspects of Basic Memory" in result
 
 
-@pytest.mark.asyncio
-async def test_timeframe_default_value(template_loader, context_with_results):
+def test_timeframe_default_value(template_loader, context_with_results):
     """Test that the timeframe uses the default value when not provided."""
     # Remove the timeframe from the context
     context_without_timeframe = context_with_results.copy()
     context_without_timeframe["timeframe"] = None
 
-    result = await template_loader.render(
-        "prompts/continue_conversation.hbs", context_without_timeframe
-    )
+    result = template_loader.render("prompts/continue_conversation.hbs", context_without_timeframe)
 
     # Check that the default value is used
     assert 'recent_activity(timeframe="7d")' in result
@@ -169,3 +169,23 @@ async def test_multiple_filters(client, indexed_entity, project_url):
     assert result.permalink == indexed_entity.permalink
     assert result.type == SearchItemType.ENTITY.value
     assert result.metadata["entity_type"] == "test"
+
+
+@pytest.mark.asyncio
+async def test_search_relation_entities(client, test_graph, entity_service, project_url):
+    """Test that relation results resolve their entity permalinks."""
+    response = await client.post(
+        f"{project_url}/search/",
+        json={"permalink_match": "test/*", "entity_types": [SearchItemType.RELATION.value]},
+    )
+    assert response.status_code == 200
+    search_results = SearchResponse.model_validate(response.json())
+    assert len(search_results.results) > 0
+
+    # Each result matches a lookup of the entities for that relation alone
+    relations_by_permalink = {r.permalink: r for r in test_graph["relations"]}
+    for result in search_results.results:
+        relation = relations_by_permalink[result.permalink]
+        entities = await entity_service.get_entities_by_id([relation.from_id, relation.to_id])
+        assert result.from_entity == entities[0].permalink
+        assert result.to_entity == (entities[1].permalink if len(entities) > 1 else None)
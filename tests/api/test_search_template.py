@@ -51,10 +51,9 @@ def context_without_results():
     }
 
 
-@pytest.mark.asyncio
-async def test_search_with_results(template_loader, context_with_results):
+def test_search_with_results(template_loader, context_with_results):
     """Test rendering the search template with results."""
-    result = await template_loader.render("prompts/search.hbs", context_with_results)
+    result = template_loader.render("prompts/search.hbs", context_with_results)
 
     # Check that key elements are present
     assert 'Search Results for: "test query" (after 30d)' in result
@@ -67,10 +66,9 @@ async def test_search_with_results(template_loader, context_with_results):
     assert "Synthesize and Capture Knowledge" in result
 
 
-@pytest.mark.asyncio
-async def test_search_without_results(template_loader, context_without_results):
+def test_search_without_results(template_loader, context_without_results):
     """Test rendering the search template without results."""
-    result = await template_loader.render("prompts/search.hbs", context_without_results)
+    result = template_loader.render("prompts/search.hbs", context_without_results)
 
     # Check that key elements are present
     assert 'Search Results for: "empty query"' in result
@@ -81,8 +79,7 @@ async def test_search_without_results(template_loader, context_without_results):
     assert "Other Suggestions" in result
 
 
-@pytest.mark.asyncio
-async def test_multiple_search_results(template_loader):
+def test_multiple_search_results(template_loader):
     """Test rendering the search template with multiple results."""
     # Create multiple search results
     results = []
@@ -107,7 +104,7 @@ async def test_multiple_search_results(template_loader):
         "results": results,
     }
 
-    result = await template_loader.render("prompts/search.hbs", context)
+    result = template_loader.render("prompts/search.hbs", context)
 
     # Check that all results are rendered
     for i in range(1, 6):
@@ -116,17 +113,15 @@ async def test_multiple_search_results(template_loader):
         assert f'read_note("test/result-{i}")' in result
 
 
-@pytest.mark.asyncio
-async def test_capitalization_in_write_note_template(template_loader, context_with_results):
+def test_capitalization_in_write_note_template(template_loader, context_with_results):
     """Test that the query is capitalized in the write_note template."""
-    result = await template_loader.render("prompts/search.hbs", context_with_results)
+    result = template_loader.render("prompts/search.hbs", context_with_results)
 
     # The query should be capitalized in the suggested write_note call
     assert "Synthesis of Test query Information" in result
 
 
-@pytest.mark.asyncio
-async def test_timeframe_display(template_loader):
+def test_timeframe_display(template_loader):
     """Test that the timeframe is displayed correctly when present, and not when absent."""
     # Context with timeframe
     context_with_timeframe = {
@@ -137,9 +132,7 @@ async def test_timeframe_display(template_loader):
         "results": [],
     }
 
-    result_with_timeframe = await template_loader.render(
-        "prompts/search.hbs", context_with_timeframe
-    )
+    result_with_timeframe = template_loader.render("prompts/search.hbs", context_with_timeframe)
     assert 'Search Results for: "with timeframe" (after 7d)' in result_with_timeframe
 
     # Context without timeframe
@@ -151,7 +144,7 @@ async def test_timeframe_display(template_loader):
         "results": [],
     }
 
-    result_without_timeframe = await template_loader.render(
+    result_without_timeframe = template_loader.render(
         "prompts/search.hbs", context_without_timeframe
     )
     assert 'Search Results for: "without timeframe"' in result_without_timeframe
@@ -28,21 +28,19 @@ def simple_template(temp_template_dir):
     return "simple.hbs"
 
 
-@pytest.mark.asyncio
-async def test_render_simple_template(custom_template_loader, simple_template):
+def test_render_simple_template(custom_template_loader, simple_template):
     """Test rendering a simple template."""
     context = {"name": "World"}
-    result = await custom_template_loader.render(simple_template, context)
+    result = custom_template_loader.render(simple_template, context)
     assert result == "Hello, World!"
 
 
-@pytest.mark.asyncio
-async def test_template_cache(custom_template_loader, simple_template):
+def test_template_cache(custom_template_loader, simple_template):
     """Test that templates are cached."""
     context = {"name": "World"}
 
     # First render, should load template
-    await custom_template_loader.render(simple_template, context)
+    custom_template_loader.render(simple_template, context)
 
     # Check that template is in cache
     assert simple_template in custom_template_loader.template_cache
@@ -52,105 +50,123 @@ async def test_template_cache(custom_template_loader, simple_template):
     template_path.write_text("Goodbye, {{name}}!", encoding="utf-8")
 
     # Second render, should use cached template
-    result = await custom_template_loader.render(simple_template, context)
+    result = custom_template_loader.render(simple_template, context)
     assert result == "Hello, World!"
 
     # Clear cache and render again - should use updated template
     custom_template_loader.clear_cache()
     assert simple_template not in custom_template_loader.template_cache
 
-    result = await custom_template_loader.render(simple_template, context)
+    result = custom_template_loader.render(simple_template, context)
     assert result == "Goodbye, World!"
 
 
-@pytest.mark.asyncio
-async def test_date_helper(custom_template_loader, temp_template_dir):
+def test_templates_precompiled_at_init(temp_template_dir):
+    """Test that existing templates are compiled when the loader is created."""
+    (temp_template_dir / "eager.hbs").write_text("Eager {{name}}", encoding="utf-8")
+    nested_dir = temp_template_dir.mkdir("nested")
+    (nested_dir / "inner.hbs").write_text("Inner {{name}}", encoding="utf-8")
+
+    loader = TemplateLoader(str(temp_template_dir))
+
+    assert "eager.hbs" in loader.template_cache
+    assert "nested/inner.hbs" in loader.template_cache
+    # Lookups with other extensions resolve to the precompiled template
+    assert loader.get_template("eager") is loader.template_cache["eager.hbs"]
+    assert loader.get_template("eager.liquid") is loader.template_cache["eager.hbs"]
+
+
+def test_date_helper(custom_template_loader, temp_template_dir):
     # Test date helper
     date_path = temp_template_dir / "date.hbs"
     date_path.write_text("{{date timestamp}}", encoding="utf-8")
-    date_result = await custom_template_loader.render(
+    date_result = custom_template_loader.render(
         "date.hbs", {"timestamp": datetime.datetime(2023, 1, 1, 12, 30)}
     )
     assert "2023-01-01" in date_result
 
+    # ISO strings are parsed and formatted; unparseable strings pass through
+    date_result = custom_template_loader.render("date.hbs", {"timestamp": "2023-01-01T12:30:00"})
+    assert date_result == "2023-01-01 12:30"
+    date_result = custom_template_loader.render("date.hbs", {"timestamp": "not a date"})
+    assert date_result == "not a date"
 
-@pytest.mark.asyncio
-async def test_default_helper(custom_template_loader, temp_template_dir):
+
+def test_default_helper(custom_template_loader, temp_template_dir):
     # Test default helper
     default_path = temp_template_dir / "default.hbs"
     default_path.write_text("{{default null 'default-value'}}", encoding="utf-8")
-    default_result = await custom_template_loader.render("default.hbs", {"null": None})
+    default_result = custom_template_loader.render("default.hbs", {"null": None})
     assert default_result == "default-value"
 
 
-@pytest.mark.asyncio
-async def test_capitalize_helper(custom_template_loader, temp_template_dir):
+def test_capitalize_helper(custom_template_loader, temp_template_dir):
     # Test capitalize helper
     capitalize_path = temp_template_dir / "capitalize.hbs"
     capitalize_path.write_text("{{capitalize 'test'}}", encoding="utf-8")
-    capitalize_result = await custom_template_loader.render("capitalize.hbs", {})
+    capitalize_result = custom_template_loader.render("capitalize.hbs", {})
     assert capitalize_result == "Test"
 
 
-@pytest.mark.asyncio
-async def test_size_helper(custom_template_loader, temp_template_dir):
+def test_size_helper(custom_template_loader, temp_template_dir):
     # Test size helper
     size_path = temp_template_dir / "size.hbs"
     size_path.write_text("{{size collection}}", encoding="utf-8")
-    size_result = await custom_template_loader.render("size.hbs", {"collection": [1, 2, 3]})
+    size_result = custom_template_loader.render("size.hbs", {"collection": [1, 2, 3]})
     assert size_result == "3"
 
 
-@pytest.mark.asyncio
-async def test_json_helper(custom_template_loader, temp_template_dir):
+def test_json_helper(custom_template_loader, temp_template_dir):
     # Test json helper
     json_path = temp_template_dir / "json.hbs"
     json_path.write_text("{{json data}}", encoding="utf-8")
-    json_result = await custom_template_loader.render("json.hbs", {"data": {"key": "value"}})
-    assert json_result == '{"key": "value"}'
+    json_result = custom_template_loader.render("json.hbs", {"data": {"key": "value"}})
+    assert json_result == '{"key":"value"}'
+
+    # Dates and other non-JSON types are encoded as strings
+    json_result = custom_template_loader.render(
+        "json.hbs", {"data": {"when": datetime.date(2023, 1, 1), "path": Path("notes/a.md")}}
+    )
+    assert json_result == '{"when":"2023-01-01","path":"notes/a.md"}'
 
 
-@pytest.mark.asyncio
-async def test_less_than_helper(custom_template_loader, temp_template_dir):
+def test_less_than_helper(custom_template_loader, temp_template_dir):
     # Test lt (less than) helper
     lt_path = temp_template_dir / "lt.hbs"
     lt_path.write_text("{{#if_cond (lt 2 3)}}true{{else}}false{{/if_cond}}", encoding="utf-8")
-    lt_result = await custom_template_loader.render("lt.hbs", {})
+    lt_result = custom_template_loader.render("lt.hbs", {})
     assert lt_result == "true"
 
 
-@pytest.mark.asyncio
-async def test_file_not_found(custom_template_loader):
+def test_file_not_found(custom_template_loader):
     """Test that FileNotFoundError is raised when a template doesn't exist."""
     with pytest.raises(FileNotFoundError):
-        await custom_template_loader.render("non_existent_template.hbs", {})
+        custom_template_loader.render("non_existent_template.hbs", {})
 
 
-@pytest.mark.asyncio
-async def test_extension_handling(custom_template_loader, temp_template_dir):
+def test_extension_handling(custom_template_loader, temp_template_dir):
     """Test that template extensions are handled correctly."""
     # Create template with .hbs extension
     template_path = temp_template_dir / "test_extension.hbs"
     template_path.write_text("Template with extension: {{value}}", encoding="utf-8")
 
     # Test accessing with full extension
-    result = await custom_template_loader.render("test_extension.hbs", {"value": "works"})
+    result = custom_template_loader.render("test_extension.hbs", {"value": "works"})
     assert result == "Template with extension: works"
 
     # Test accessing without extension
-    result = await custom_template_loader.render("test_extension", {"value": "also works"})
+    result = custom_template_loader.render("test_extension", {"value": "also works"})
     assert result == "Template with extension: also works"
 
     # Test accessing with wrong extension gets converted
     template_path = temp_template_dir / "liquid_template.hbs"
     template_path.write_text("Liquid template: {{value}}", encoding="utf-8")
 
-    result = await custom_template_loader.render("liquid_template.liquid", {"value": "converted"})
+    result = custom_template_loader.render("liquid_template.liquid", {"value": "converted"})
     assert result == "Liquid template: converted"
 
 
-@pytest.mark.asyncio
-async def test_dedent_helper(custom_template_loader, temp_template_dir):
+def test_dedent_helper(custom_template_loader, temp_template_dir):
     """Test the dedent helper for text blocks."""
     dedent_path = temp_template_dir / "dedent.hbs"
 
@@ -167,7 +183,7 @@ After"""
     dedent_path.write_text(template_content, encoding="utf-8")
 
     # Render the template
-    result = await custom_template_loader.render("dedent.hbs", {})
+    result = custom_template_loader.render("dedent.hbs", {})
 
     # Print the actual output for debugging
     print(f"Dedent helper result: {repr(result)}")
@@ -184,8 +200,7 @@ After"""
     assert result.find("with nested indentation") > result.find("This is indented text")
 
 
-@pytest.mark.asyncio
-async def test_nested_dedent_helper(custom_template_loader, temp_template_dir):
+def test_nested_dedent_helper(custom_template_loader, temp_template_dir):
     """Test the dedent helper with nested content."""
     dedent_path = temp_template_dir / "nested_dedent.hbs"
 
@@ -204,7 +219,7 @@ async def test_nested_dedent_helper(custom_template_loader, temp_template_dir):
     dedent_path.write_text(template_content, encoding="utf-8")
 
     # Render the template
-    result = await custom_template_loader.render("nested_dedent.hbs", {"items": [1, 2]})
+    result = custom_template_loader.render("nested_dedent.hbs", {"items": [1, 2]})
 
     # Print the actual output for debugging
     print(f"Actual result: {repr(result)}")
@@ -19,8 +19,7 @@ def custom_template_loader(temp_template_dir):
     return TemplateLoader(str(temp_template_dir))
 
 
-@pytest.mark.asyncio
-async def test_round_helper(custom_template_loader, temp_template_dir):
+def test_round_helper(custom_template_loader, temp_template_dir):
     """Test the round helper for number formatting."""
     # Create template file
     round_path = temp_template_dir / "round.hbs"
@@ -30,22 +29,21 @@ async def test_round_helper(custom_template_loader, temp_template_dir):
     )
 
     # Test with various values
-    result = await custom_template_loader.render("round.hbs", {"number": 3.14159})
+    result = custom_template_loader.render("round.hbs", {"number": 3.14159})
     assert result == "3.14 3.0 3.142" or result == "3.14 3 3.142"
 
     # Test with non-numeric value
-    result = await custom_template_loader.render("round.hbs", {"number": "not-a-number"})
+    result = custom_template_loader.render("round.hbs", {"number": "not-a-number"})
     assert "not-a-number" in result
 
     # Test with insufficient args
     empty_path = temp_template_dir / "round_empty.hbs"
     empty_path.write_text("{{round}}", encoding="utf-8")
-    result = await custom_template_loader.render("round_empty.hbs", {})
+    result = custom_template_loader.render("round_empty.hbs", {})
     assert result == ""
 
 
-@pytest.mark.asyncio
-async def test_date_helper_edge_cases(custom_template_loader, temp_template_dir):
+def test_date_helper_edge_cases(custom_template_loader, temp_template_dir):
     """Test edge cases for the date helper."""
     # Create template file
     date_path = temp_template_dir / "date_edge.hbs"
@@ -55,7 +53,7 @@ async def test_date_helper_edge_cases(custom_template_loader, temp_template_dir)
     )
 
     # Test with various values
-    result = await custom_template_loader.render(
+    result = custom_template_loader.render(
         "date_edge.hbs",
         {
             "timestamp": datetime(2023, 1, 1, 12, 30),
@@ -70,8 +68,7 @@ async def test_date_helper_edge_cases(custom_template_loader, temp_template_dir)
     assert result.strip() != ""  # Empty date case
 
 
-@pytest.mark.asyncio
-async def test_size_helper_edge_cases(custom_template_loader, temp_template_dir):
+def test_size_helper_edge_cases(custom_template_loader, temp_template_dir):
     """Test edge cases for the size helper."""
     # Create template file
     size_path = temp_template_dir / "size_edge.hbs"
@@ -81,7 +78,7 @@ async def test_size_helper_edge_cases(custom_template_loader, temp_template_dir)
     )
 
     # Test with various values
-    result = await custom_template_loader.render(
+    result = custom_template_loader.render(
         "size_edge.hbs",
         {
             "list": [1, 2, 3, 4, 5],
@@ -98,8 +95,7 @@ async def test_size_helper_edge_cases(custom_template_loader, temp_template_dir)
     assert result.count("0") >= 2  # At least two zeros (null and empty args)
 
 
-@pytest.mark.asyncio
-async def test_math_helper(custom_template_loader, temp_template_dir):
+def test_math_helper(custom_template_loader, temp_template_dir):
     """Test the math helper for basic arithmetic."""
     # Create template file
     math_path = temp_template_dir / "math.hbs"
@@ -109,7 +105,7 @@ async def test_math_helper(custom_template_loader, temp_template_dir):
     )
 
     # Test basic operations
-    result = await custom_template_loader.render("math.hbs", {})
+    result = custom_template_loader.render("math.hbs", {})
     assert "8" in result  # Addition
     assert "6" in result  # Subtraction
     assert "42" in result  # Multiplication
@@ -118,24 +114,23 @@ async def test_math_helper(custom_template_loader, temp_template_dir):
     # Test with invalid operator
     invalid_op_path = temp_template_dir / "math_invalid_op.hbs"
     invalid_op_path.write_text("{{math 5 'invalid' 3}}", encoding="utf-8")
-    result = await custom_template_loader.render("math_invalid_op.hbs", {})
+    result = custom_template_loader.render("math_invalid_op.hbs", {})
     assert "Unsupported operator" in result
 
     # Test with invalid numeric values
     invalid_num_path = temp_template_dir / "math_invalid_num.hbs"
     invalid_num_path.write_text("{{math 'not-a-number' '+' 3}}", encoding="utf-8")
-    result = await custom_template_loader.render("math_invalid_num.hbs", {})
+    result = custom_template_loader.render("math_invalid_num.hbs", {})
     assert "Math error" in result
 
     # Test with insufficient arguments
     insufficient_path = temp_template_dir / "math_insufficient.hbs"
     insufficient_path.write_text("{{math 5 '+'}}", encoding="utf-8")
-    result = await custom_template_loader.render("math_insufficient.hbs", {})
+    result = custom_template_loader.render("math_insufficient.hbs", {})
     assert "Insufficient arguments" in result
 
 
-@pytest.mark.asyncio
-async def test_if_cond_helper(custom_template_loader, temp_template_dir):
+def test_if_cond_helper(custom_template_loader, temp_template_dir):
     """Test the if_cond helper for conditionals."""
     # Create template file with true condition
     if_true_path = temp_template_dir / "if_true.hbs"
@@ -152,16 +147,15 @@ async def test_if_cond_helper(custom_template_loader, temp_template_dir):
     )
 
     # Test true condition
-    result = await custom_template_loader.render("if_true.hbs", {})
+    result = custom_template_loader.render("if_true.hbs", {})
     assert result == "True condition"
 
     # Test false condition
-    result = await custom_template_loader.render("if_false.hbs", {})
+    result = custom_template_loader.render("if_false.hbs", {})
     assert result == "False condition"
 
 
-@pytest.mark.asyncio
-async def test_lt_helper_edge_cases(custom_template_loader, temp_template_dir):
+def test_lt_helper_edge_cases(custom_template_loader, temp_template_dir):
     """Test edge cases for the lt (less than) helper."""
     # Create template file
     lt_path = temp_template_dir / "lt_edge.hbs"
@@ -173,21 +167,20 @@ async def test_lt_helper_edge_cases(custom_template_loader, temp_template_dir):
     )
 
     # Test with string values and missing args
-    result = await custom_template_loader.render("lt_edge.hbs", {})
+    result = custom_template_loader.render("lt_edge.hbs", {})
     assert "String LT True" in result  # 'a' < 'b' is true
     assert "String LT2 False" in result  # 'z' < 'a' is false
     assert "Missing args False" in result  # Missing args should return false
 
 
-@pytest.mark.asyncio
-async def test_dedent_helper_edge_case(custom_template_loader, temp_template_dir):
+def test_dedent_helper_edge_case(custom_template_loader, temp_template_dir):
     """Test an edge case for the dedent helper."""
     # Create template with empty dedent block
     empty_dedent_path = temp_template_dir / "empty_dedent.hbs"
     empty_dedent_path.write_text("{{#dedent}}{{/dedent}}", encoding="utf-8")
 
     # Test empty block
-    result = await custom_template_loader.render("empty_dedent.hbs", {})
+    result = custom_template_loader.render("empty_dedent.hbs", {})
     assert result == ""
 
     # Test with complex content including lists
@@ -197,7 +190,7 @@ async def test_dedent_helper_edge_case(custom_template_loader, temp_template_dir
         encoding="utf-8",
     )
 
-    result = await custom_template_loader.render("complex_dedent.hbs", {"items": [1, 2, 3]})
+    result = custom_template_loader.render("complex_dedent.hbs", {"items": [1, 2, 3]})
     assert "- 1" in result
     assert "- 2" in result
     assert "- 3" in result
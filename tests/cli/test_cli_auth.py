@@ -0,0 +1,31 @@
+"""Tests for CLIAuth token storage."""
+
+import json
+
+from basic_memory.cli.auth import CLIAuth
+
+
+def test_load_tokens_reads_current_file(tmp_path, app_config):
+    """Test that load_tokens always reflects the token file on disk."""
+    auth = CLIAuth(client_id="client_id", authkit_domain="https://auth.example.com")
+    auth.token_file = tmp_path / "basic-memory-cloud.json"
+
+    assert auth.load_tokens() is None
+
+    auth.save_tokens({"access_token": "first", "expires_in": 3600})
+    tokens = auth.load_tokens()
+    assert tokens is not None
+    assert tokens["access_token"] == "first"
+
+    # A same-size rewrite (e.g. from another process) is picked up immediately
+    auth.token_file.write_text(json.dumps({"access_token": "other", "expires_at": 0}))
+    tokens = auth.load_tokens()
+    assert tokens is not None
+    assert tokens["access_token"] == "other"
+
+    # Invalid JSON is treated as no tokens
+    auth.token_file.write_text("{not json")
+    assert auth.load_tokens() is None
+
+    auth.logout()
+    assert auth.load_tokens() is None
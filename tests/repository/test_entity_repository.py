@@ -607,6 +607,31 @@ async def test_find_by_directory_prefix(entity_repository: EntityRepository, ses
     assert len(nonexistent) == 0
 
 
+@pytest.mark.asyncio
+async def test_find_by_directory_prefix_matches_literally(
+    entity_repository: EntityRepository, session_maker
+):
+    """Test that directory names are matched literally, not as LIKE patterns."""
+    async with db.scoped_session(session_maker) as session:
+        for file_path in ["my_dir/a.md", "myXdir/b.md", "my_dir-old/c.md", "my_dir0/d.md"]:
+            session.add(
+                Entity(
+                    project_id=entity_repository.project_id,
+                    title=file_path,
+                    entity_type="test",
+                    permalink=file_path.removesuffix(".md"),
+                    file_path=file_path,
+                    content_type="text/markdown",
+                    created_at=datetime.now(timezone.utc),
+                    updated_at=datetime.now(timezone.utc),
+                )
+            )
+        await session.flush()
+
+    entities = await entity_repository.find_by_directory_prefix("my_dir")
+    assert [e.file_path for e in entities] == ["my_dir/a.md"]
+
+
 @pytest.mark.asyncio
 async def test_find_by_directory_prefix_basic_fields_only(
     entity_repository: EntityRepository, session_maker
@@ -810,3 +835,34 @@ async def test_get_all_file_paths_project_isolation(
     # Should only include files from project 1
     assert len(file_paths) == 1
     assert file_paths == ["test/file1.md"]
+
+
+@pytest.mark.asyncio
+async def test_get_distinct_directories_trims_file_names(
+    entity_repository: EntityRepository, session_maker
+):
+    """Test that file names sharing characters with their directory are trimmed exactly."""
+    async with db.scoped_session(session_maker) as session:
+        session.add_all(
+            [
+                Entity(
+                    project_id=entity_repository.project_id,
+                    title=title,
+                    entity_type="test",
+                    permalink=file_path.removesuffix(".md"),
+                    file_path=file_path,
+                    content_type="text/markdown",
+                    created_at=datetime.now(timezone.utc),
+                    updated_at=datetime.now(timezone.utc),
+                )
+                for title, file_path in [
+                    ("Root", "root.md"),
+                    ("Docs", "docs/docs.md"),
+                    ("Nested", "docs/docs/docs.md"),
+                ]
+            ]
+        )
+        await session.flush()
+
+    directories = await entity_repository.get_distinct_directories()
+    assert directories == ["docs", "docs/docs"]
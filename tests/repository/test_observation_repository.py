@@ -9,6 +9,7 @@ from sqlalchemy.ext.asyncio import async_sessionmaker
 
 from basic_memory import db
 from basic_memory.models import Entity, Observation, Project
+from basic_memory.repository import observation_repository as observation_repository_module
 from basic_memory.repository.observation_repository import ObservationRepository
 
 
@@ -356,3 +357,46 @@ async def test_find_by_category_case_sensitivity(
 
     upper_case = await repo.find_by_category("TECH")
     assert len(upper_case) == 0  # Currently case-sensitive
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("chunk_size", [500, 1])
+async def test_find_by_entities(
+    session_maker: async_sessionmaker, repo, test_project: Project, monkeypatch, chunk_size
+):
+    """Test grouping observations for several entities, in one or several chunks."""
+    monkeypatch.setattr(observation_repository_module, "IN_CLAUSE_CHUNK_SIZE", chunk_size)
+
+    async with db.scoped_session(session_maker) as session:
+        entities = [
+            Entity(
+                project_id=test_project.id,
+                title=f"entity_{i}",
+                entity_type="test",
+                permalink=f"test/entity-{i}",
+                file_path=f"test/entity_{i}.md",
+                content_type="text/markdown",
+                created_at=datetime.now(timezone.utc),
+                updated_at=datetime.now(timezone.utc),
+            )
+            for i in range(3)
+        ]
+        session.add_all(entities)
+        await session.flush()
+
+        # Interleave observations across the first two entities
+        session.add_all(
+            [
+                Observation(entity_id=entities[1].id, content="b1"),
+                Observation(entity_id=entities[0].id, content="a1"),
+                Observation(entity_id=entities[1].id, content="b2"),
+                Observation(entity_id=entities[0].id, content="a2"),
+            ]
+        )
+
+    observations_by_entity = await repo.find_by_entities([e.id for e in entities])
+
+    # Entities without observations are absent
+    assert set(observations_by_entity) == {entities[0].id, entities[1].id}
+    assert [o.content for o in observations_by_entity[entities[0].id]] == ["a1", "a2"]
+    assert [o.content for o in observations_by_entity[entities[1].id]] == ["b1", "b2"]
@@ -83,6 +83,32 @@ async def test_init_search_index(search_repository):
         assert result.scalar() == "search_index"
 
 
+@pytest.mark.asyncio
+async def test_optimize_search_index(search_repository, search_entity):
+    """Test that optimizing the index keeps indexed rows searchable."""
+    search_row = SearchIndexRow(
+        id=search_entity.id,
+        type=SearchItemType.ENTITY.value,
+        title=search_entity.title,
+        content_stems="optimize test entity content",
+        content_snippet="This is a test entity for optimize",
+        permalink=search_entity.permalink,
+        file_path=search_entity.file_path,
+        entity_id=search_entity.id,
+        metadata={"entity_type": search_entity.entity_type},
+        created_at=search_entity.created_at,
+        updated_at=search_entity.updated_at,
+        project_id=search_repository.project_id,
+    )
+    await search_repository.index_item(search_row)
+
+    await search_repository.optimize_search_index()
+
+    results = await search_repository.search(search_text="optimize test")
+    assert len(results) == 1
+    assert results[0].title == search_entity.title
+
+
 @pytest.mark.asyncio
 async def test_index_item(search_repository, search_entity):
     """Test indexing an item with project_id."""
@@ -291,6 +317,17 @@ def test_directory_property():
     )
     assert row2.directory == "/"
 
+    # Test a Windows-style path
+    row_windows = SearchIndexRow(
+        id=4,
+        type=SearchItemType.ENTITY.value,
+        file_path="projects\\notes\\ideas.md",
+        created_at=datetime.now(timezone.utc),
+        updated_at=datetime.now(timezone.utc),
+        project_id=1,
+    )
+    assert row_windows.directory == "/projects/notes"
+
     # Test a non-entity type with empty file_path
     row3 = SearchIndexRow(
         id=3,
@@ -2,7 +2,7 @@
 
 import os
 import pytest
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from pydantic import ValidationError, BaseModel
 
 from basic_memory.schemas import (
@@ -14,7 +14,13 @@ from basic_memory.schemas import (
     RelationResponse,
 )
 from basic_memory.schemas.request import EditEntityRequest
-from basic_memory.schemas.base import to_snake_case, TimeFrame, parse_timeframe, validate_timeframe
+from basic_memory.schemas.base import (
+    to_snake_case,
+    TimeFrame,
+    parse_datetime,
+    parse_timeframe,
+    validate_timeframe,
+)
 
 
 def test_entity_project_name():
@@ -364,6 +370,28 @@ class TestTimeframeParsing:
         assert diff < 3600  # Within 1 hour tolerance
         assert result_week.tzinfo is not None
 
+    def test_parse_datetime_fast_formats(self):
+        """Test that parse_datetime handles relative and ISO formats without dateparser."""
+        now = datetime.now()
+
+        for value, delta in [
+            ("7d", timedelta(days=7)),
+            ("3 days", timedelta(days=3)),
+            ("2 weeks ago", timedelta(weeks=2)),
+            ("6h", timedelta(hours=6)),
+            ("30 Minutes ago", timedelta(minutes=30)),
+            ("yesterday", timedelta(days=1)),
+        ]:
+            result = parse_datetime(value)
+            assert result is not None
+            assert abs((now - delta - result).total_seconds()) < 2, value
+
+        assert parse_datetime("2025-01-15") == datetime(2025, 1, 15)
+        assert parse_datetime("2025-01-15T10:30:00+00:00") == datetime(
+            2025, 1, 15, 10, 30, tzinfo=timezone.utc
+        )
+        assert parse_datetime("not-a-date") is None
+
     def test_parse_timeframe_invalid(self):
         """Test that parse_timeframe raises ValueError for invalid input."""
         with pytest.raises(ValueError, match="Could not parse timeframe: invalid-timeframe"):
@@ -202,6 +202,37 @@ async def test_build_context_with_observations(context_service, test_graph):
     assert "Root note" in note_observation.content
 
 
+@pytest.mark.asyncio
+async def test_build_context_batch(context_service, test_graph):
+    """Test batched context matches building context for each permalink."""
+    permalinks = [
+        test_graph["root"].permalink,
+        test_graph["connected1"].permalink,
+        "does/not/exist",
+    ]
+    batch = await context_service.build_context_batch(permalinks, include_observations=True)
+
+    assert list(batch.keys()) == permalinks
+    for permalink in permalinks:
+        expected = await context_service.build_context(permalink, include_observations=True)
+        context_result = batch[permalink]
+
+        assert context_result.metadata.uri == expected.metadata.uri
+        assert context_result.metadata.primary_count == expected.metadata.primary_count
+        assert context_result.metadata.related_count == expected.metadata.related_count
+        assert context_result.metadata.total_observations == expected.metadata.total_observations
+        assert [item.primary_result.id for item in context_result.results] == [
+            item.primary_result.id for item in expected.results
+        ]
+        for item, expected_item in zip(context_result.results, expected.results):
+            assert [o.id for o in item.observations] == [o.id for o in expected_item.observations]
+            assert [(r.type, r.id) for r in item.related_results] == [
+                (r.type, r.id) for r in expected_item.related_results
+            ]
+
+    assert batch["does/not/exist"].results == []
+
+
 @pytest.mark.asyncio
 async def test_build_context_not_found(context_service):
     """Test handling non-existent permalinks."""
@@ -5,6 +5,7 @@ import tempfile
 from pathlib import Path
 
 import pytest
+from sqlalchemy import text
 
 from basic_memory.schemas import (
     ProjectInfoResponse,
@@ -138,6 +139,27 @@ async def test_get_statistics(project_service: ProjectService, test_graph, test_
     assert "test" in statistics.entity_types
 
 
+@pytest.mark.asyncio
+async def test_get_statistics_totals_match_groups(
+    project_service: ProjectService, test_graph, test_project
+):
+    """Test that totals derived from the grouped counts match direct counts."""
+    statistics = await project_service.get_statistics(test_project.id)
+
+    assert statistics.total_entities == sum(statistics.entity_types.values())
+    assert statistics.total_observations == sum(statistics.observation_categories.values())
+    assert statistics.total_relations == sum(statistics.relation_types.values())
+
+    unresolved_result = await project_service.repository.execute_query(
+        text(
+            "SELECT COUNT(*) FROM relation r JOIN entity e ON r.from_id = e.id "
+            "WHERE r.to_id IS NULL AND e.project_id = :project_id"
+        ),
+        {"project_id": test_project.id},
+    )
+    assert statistics.total_unresolved_relations == unresolved_result.scalar()
+
+
 @pytest.mark.asyncio
 async def test_get_activity_metrics(project_service: ProjectService, test_graph, test_project):
     """Test getting activity metrics."""
@@ -150,6 +172,39 @@ async def test_get_activity_metrics(project_service: ProjectService, test_graph,
     assert len(metrics.recently_updated) > 0
 
 
+@pytest.mark.asyncio
+async def test_get_activity_metrics_row_keys(
+    project_service: ProjectService, test_graph, test_project
+):
+    """Test that activity and statistics rows are keyed by their column names."""
+    metrics = await project_service.get_activity_metrics(test_project.id)
+    assert set(metrics.recently_created[0]) == {
+        "id",
+        "title",
+        "permalink",
+        "entity_type",
+        "created_at",
+        "file_path",
+    }
+    assert set(metrics.recently_updated[0]) == {
+        "id",
+        "title",
+        "permalink",
+        "entity_type",
+        "updated_at",
+        "file_path",
+    }
+
+    statistics = await project_service.get_statistics(test_project.id)
+    assert set(statistics.most_connected_entities[0]) == {
+        "id",
+        "title",
+        "permalink",
+        "relation_count",
+        "file_path",
+    }
+
+
 @pytest.mark.asyncio
 async def test_get_project_info(project_service: ProjectService, test_graph, test_project):
     """Test getting full project info."""
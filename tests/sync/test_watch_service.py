@@ -530,3 +530,21 @@ async def test_handle_changes_skips_deleted_project(
         assert entity_after.checksum == entity_before.checksum, (
             "Entity should not be updated for deleted project"
         )
+
+
+@pytest.mark.asyncio
+async def test_handle_changes_reuses_sync_service(watch_service, project_config, test_project):
+    """Test that batches of changes for a project share one sync service."""
+    project_dir = project_config.home
+
+    first_file = project_dir / "first.md"
+    await create_test_file(first_file, "# First")
+    await watch_service.handle_changes(test_project, {(Change.added, str(first_file))})
+
+    sync_service = watch_service._sync_service_cache[test_project.id]
+
+    second_file = project_dir / "second.md"
+    await create_test_file(second_file, "# Second")
+    await watch_service.handle_changes(test_project, {(Change.added, str(second_file))})
+
+    assert await watch_service._get_sync_service(test_project) is sync_service